@@ -294,6 +294,95 @@ class CANBusManager(QObject):
         
         print("[DEBUG] Disconnected from CAN bus")
 
+    def _build_message(self, msg_id, data, extended_id=False, fd=False):
+        """Validate a frame's ID and payload and build its can.Message.
+        Raises ValueError with a user-facing description when either is invalid."""
+        # Windows-safe message ID validation and conversion
+        try:
+            if isinstance(msg_id, str):
+                # Handle hex strings with various formats
+                clean_id = msg_id.strip().lower()
+                if clean_id.startswith('0x'):
+                    message_id = int(clean_id, 16)
+                elif clean_id.startswith('0b'):
+                    message_id = int(clean_id, 2)
+                else:
+                    # Try hex first, then decimal
+                    try:
+                        message_id = int(clean_id, 16)
+                    except ValueError:
+                        message_id = int(clean_id, 10)
+            else:
+                message_id = int(msg_id)
+            
+            # Validate CAN ID range
+            if extended_id:
+                if not (0 <= message_id <= 0x1FFFFFFF):  # 29-bit extended ID
+                    raise ValueError(f"Extended CAN ID out of range: 0x{message_id:X}")
+            else:
+                if not (0 <= message_id <= 0x7FF):  # 11-bit standard ID
+                    raise ValueError(f"Standard CAN ID out of range: 0x{message_id:X}")
+                    
+        except (ValueError, TypeError) as e:
+            raise ValueError(f"Invalid message ID '{msg_id}': {e}") from None
+        
+        # Windows-safe data conversion and validation
+        bad_hex = None
+        try:
+            data_bytes = bytearray()
+            
+            if data is None:
+                data_bytes = bytearray()
+            elif isinstance(data, (bytes, bytearray)):
+                data_bytes = bytearray(data)
+            elif isinstance(data, (list, tuple)):
+                # Convert list/tuple to bytes with validation
+                for item in data:
+                    byte_val = int(item) & 0xFF  # Ensure byte range 0-255
+                    data_bytes.append(byte_val)
+            elif isinstance(data, str):
+                # Handle hex string data like "01 02 03" or "010203"
+                clean_data = data.strip().replace(' ', '').replace('0x', '').replace('0X', '')
+                if clean_data:
+                    # Ensure even number of hex digits
+                    if len(clean_data) % 2:
+                        clean_data = '0' + clean_data
+                    
+                    for i in range(0, len(clean_data), 2):
+                        try:
+                            byte_val = int(clean_data[i:i+2], 16)
+                            data_bytes.append(byte_val)
+                        except ValueError:
+                            bad_hex = f"Invalid hex data at position {i}: '{clean_data[i:i+2]}'"
+                            break
+            elif isinstance(data, int):
+                # Single integer as single byte
+                data_bytes.append(int(data) & 0xFF)
+            else:
+                # Try to convert to bytes
+                try:
+                    data_bytes = bytearray(data)
+                except (TypeError, ValueError):
+                    data_bytes = bytearray()
+            
+            # Validate data length (CAN: 0-8 bytes, CAN-FD: 0-64 bytes)
+            max_length = 64 if fd else 8
+            if len(data_bytes) > max_length:
+                print(f"[WARNING] Data length {len(data_bytes)} exceeds maximum {max_length}, truncating")
+                data_bytes = data_bytes[:max_length]
+                
+        except Exception as e:
+            raise ValueError(f"Data conversion error: {e}") from None
+        if bad_hex:
+            raise ValueError(bad_hex)
+        
+        return can.Message(
+            arbitration_id=message_id,
+            data=data_bytes,
+            is_extended_id=bool(extended_id),
+            is_fd=bool(fd)
+        )
+
     def send_message(self, msg_id, data, extended_id=False, fd=False):
         """Send a CAN message with Windows-compatible data handling."""
         if not self.bus or not self.is_connected:
@@ -303,105 +392,21 @@ class CANBusManager(QObject):
             return False
         
         try:
-            # Windows-safe message ID validation and conversion
-            try:
-                if isinstance(msg_id, str):
-                    # Handle hex strings with various formats
-                    clean_id = msg_id.strip().lower()
-                    if clean_id.startswith('0x'):
-                        message_id = int(clean_id, 16)
-                    elif clean_id.startswith('0b'):
-                        message_id = int(clean_id, 2)
-                    else:
-                        # Try hex first, then decimal
-                        try:
-                            message_id = int(clean_id, 16)
-                        except ValueError:
-                            message_id = int(clean_id, 10)
-                else:
-                    message_id = int(msg_id)
-                
-                # Validate CAN ID range
-                if extended_id:
-                    if not (0 <= message_id <= 0x1FFFFFFF):  # 29-bit extended ID
-                        raise ValueError(f"Extended CAN ID out of range: 0x{message_id:X}")
-                else:
-                    if not (0 <= message_id <= 0x7FF):  # 11-bit standard ID
-                        raise ValueError(f"Standard CAN ID out of range: 0x{message_id:X}")
-                        
-            except (ValueError, TypeError) as e:
-                error_msg = f"Invalid message ID '{msg_id}': {e}"
-                print(f"[ERROR] {error_msg}")
-                self.error_occurred.emit(error_msg)
-                return False
-            
-            # Windows-safe data conversion and validation
             try:
-                data_bytes = bytearray()
-                
-                if data is None:
-                    data_bytes = bytearray()
-                elif isinstance(data, (bytes, bytearray)):
-                    data_bytes = bytearray(data)
-                elif isinstance(data, (list, tuple)):
-                    # Convert list/tuple to bytes with validation
-                    for item in data:
-                        byte_val = int(item) & 0xFF  # Ensure byte range 0-255
-                        data_bytes.append(byte_val)
-                elif isinstance(data, str):
-                    # Handle hex string data like "01 02 03" or "010203"
-                    clean_data = data.strip().replace(' ', '').replace('0x', '').replace('0X', '')
-                    if clean_data:
-                        # Ensure even number of hex digits
-                        if len(clean_data) % 2:
-                            clean_data = '0' + clean_data
-                        
-                        for i in range(0, len(clean_data), 2):
-                            try:
-                                byte_val = int(clean_data[i:i+2], 16)
-                                data_bytes.append(byte_val)
-                            except ValueError:
-                                error_msg = f"Invalid hex data at position {i}: '{clean_data[i:i+2]}'"
-                                print(f"[ERROR] {error_msg}")
-                                self.error_occurred.emit(error_msg)
-                                return False
-                elif isinstance(data, int):
-                    # Single integer as single byte
-                    data_bytes.append(int(data) & 0xFF)
-                else:
-                    # Try to convert to bytes
-                    try:
-                        data_bytes = bytearray(data)
-                    except (TypeError, ValueError):
-                        data_bytes = bytearray()
-                
-                # Validate data length (CAN: 0-8 bytes, CAN-FD: 0-64 bytes)
-                max_length = 64 if fd else 8
-                if len(data_bytes) > max_length:
-                    print(f"[WARNING] Data length {len(data_bytes)} exceeds maximum {max_length}, truncating")
-                    data_bytes = data_bytes[:max_length]
-                    
-            except Exception as e:
-                error_msg = f"Data conversion error: {e}"
+                msg = self._build_message(msg_id, data, extended_id, fd)
+            except ValueError as e:
+                error_msg = str(e)
                 print(f"[ERROR] {error_msg}")
                 self.error_occurred.emit(error_msg)
                 return False
             
-            # Create CAN message with validated parameters
+            # Send the CAN message with validated parameters
             try:
-                msg = can.Message(
-                    arbitration_id=message_id,
-                    data=data_bytes,
-                    is_extended_id=bool(extended_id),
-                    is_fd=bool(fd)
-                )
-                
-                # Send the message
                 self.bus.send(msg)
                 
                 # Create hex string for logging
-                hex_data = ' '.join(f'{b:02X}' for b in data_bytes) if data_bytes else '(no data)'
-                print(f"[DEBUG] Sent CAN message: ID=0x{message_id:X}, DLC={len(data_bytes)}, Data={hex_data}, Extended={extended_id}, FD={fd}")
+                hex_data = ' '.join(f'{b:02X}' for b in msg.data) if msg.data else '(no data)'
+                print(f"[DEBUG] Sent CAN message: ID=0x{msg.arbitration_id:X}, DLC={len(msg.data)}, Data={hex_data}, Extended={extended_id}, FD={fd}")
                 
                 return True
                 
@@ -417,6 +422,38 @@ class CANBusManager(QObject):
             self.error_occurred.emit(error_msg)
             return False
 
+    def send_messages(self, frames):
+        """Send a batch of CAN frames (dicts with 'id', 'data' and optional 'is_extended'/'is_fd').
+        Frames are validated like send_message; returns the number of frames sent."""
+        if not self.bus or not self.is_connected:
+            error_msg = 'Not connected to CAN bus'
+            print(f"[ERROR] {error_msg}")
+            self.error_occurred.emit(error_msg)
+            return 0
+        
+        build = self._build_message
+        bus_send = self.bus.send
+        sent = 0
+        failed = 0
+        last_error = None
+        
+        for frame in frames:
+            # No per-frame logging; failures are reported once for the whole batch
+            try:
+                bus_send(build(frame['id'], frame.get('data'),
+                               frame.get('is_extended', False), frame.get('is_fd', False)))
+                sent += 1
+            except Exception as e:
+                failed += 1
+                last_error = e
+        
+        if failed:
+            error_msg = f"Failed to send {failed} of {len(frames)} CAN frames: {last_error}"
+            print(f"[ERROR] {error_msg}")
+            self.error_occurred.emit(error_msg)
+        
+        return sent
+
     def register_isotp_stack(self, tx_id, rx_id, isotp_stack):
         """Register an ISOTP stack for specific CAN IDs with Windows-safe handling"""
         try:
@@ -7,6 +7,7 @@ Enhanced version with modern UI and advanced features
 import sys
 import os
 import json
+import multiprocessing
 from pathlib import Path
 from PySide6.QtWidgets import (QApplication, QMainWindow, QVBoxLayout, 
                                QHBoxLayout, QWidget, QSplitter, QPushButton,
@@ -176,6 +177,7 @@ class CANAnalyzerMainWindow(QMainWindow):
         left_sidebar.connect_requested.connect(self.handle_can_connect)
         left_sidebar.disconnect_requested.connect(self.handle_can_disconnect)
         left_sidebar.send_message.connect(self.handle_can_send_message)
+        left_sidebar.send_messages_batch.connect(self.handle_can_send_messages)
 
         # Connect CAN manager signals to UI components
         self.can_manager.message_received.connect(lambda msg: self.handle_can_message(msg, message_log))
@@ -221,6 +223,9 @@ class CANAnalyzerMainWindow(QMainWindow):
                         data['message_log'].refresh_dbc()
                     if hasattr(data['signal_plotter'], 'refresh_dbc'):
                         data['signal_plotter'].refresh_dbc()
+                    # Drops the sidebar's DBC lookups and the TX dialog's cached message labels
+                    if hasattr(data.get('left_sidebar'), 'invalidate_dbc_cache'):
+                        data['left_sidebar'].invalidate_dbc_cache()
         self.dbc_manager.dbc_loaded.connect(on_dbc_loaded)
 
         # Toolbar connections
@@ -547,6 +552,41 @@ class CANAnalyzerMainWindow(QMainWindow):
             traceback.print_exc()
             self.status_bar.show_message(f"Send Error: {e}", 5000)
 
+    def handle_can_send_messages(self, messages):
+        """Handle a batch of periodic messages due in the same sidebar scheduler tick"""
+        try:
+            frames = [{
+                'id': msg['id'],
+                'data': bytes(msg['data']),
+                'is_extended': msg.get('extended', False),
+                'is_fd': msg.get('fd', False),
+            } for msg in messages]
+            self.can_manager.send_messages(frames)
+            
+            # Add TX messages to current workspace's message log
+            idx = self.workspace_tabs.currentIndex()
+            workspace_data = self.workspace_tabs.tabBar().tabData(idx)
+            if workspace_data and 'message_log' in workspace_data:
+                message_log = workspace_data['message_log']
+                timestamp = time.time()
+                channel = self.can_manager.interface or 'unknown'
+                for msg in messages:
+                    message_log.add_message({
+                        'timestamp': timestamp,
+                        'id': msg['id'],
+                        'dlc': msg['dlc'],
+                        'data': msg['data'],
+                        'extended': msg.get('extended', False),
+                        'direction': 'TX',
+                        'channel': channel
+                    })
+                
+        except Exception as e:
+            print(f"[ERROR] handle_can_send_messages: {e}")
+            import traceback
+            traceback.print_exc()
+            self.status_bar.show_message(f"Send Error: {e}", 5000)
+
     def handle_can_message(self, msg, message_log):
         """Handle received CAN message"""
         print(f"[DEBUG] Received CAN message: ID=0x{msg['id']:X}, Data={msg['data']}, DLC={msg['dlc']}")
@@ -709,4 +749,5 @@ def main():
     return app.exec()
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()  # DBC search runs in a spawned process
     sys.exit(main())
\ No newline at end of file
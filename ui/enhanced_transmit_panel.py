@@ -9,7 +9,7 @@ from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QTableWidget,
                                QLabel, QComboBox, QCheckBox, QSplitter, QTextEdit,
                                QGroupBox, QFormLayout, QSpinBox, QFrame, QProgressBar,
                                QCompleter, QListWidget, QDialog, QDialogButtonBox)
-from PySide6.QtCore import Signal, Qt, QTimer, Slot, QStringListModel
+from PySide6.QtCore import Signal, Qt, QTimer, Slot, QStringListModel, QSignalBlocker
 from PySide6.QtGui import QFont, QColor, QPalette
 
 import time
@@ -28,6 +28,7 @@ class DBCSearchDialog(QDialog):
         super().__init__(parent)
         self.threading_manager = threading_manager
         self.current_request_id = None
+        self._last_results: List[Dict[str, Any]] = []  # Row index -> result dict
         
         self.setWindowTitle("🔍 DBC Database Search")
         self.setModal(True)
@@ -123,7 +124,8 @@ class DBCSearchDialog(QDialog):
     def on_search_text_changed(self, text: str):
         """Auto-search with debouncing"""
         if len(text) >= 2:  # Start searching after 2 characters
-            self.search_timer.start(300)  # 300ms debounce
+            # Longer terms match fewer entries and are cheaper to run
+            self.search_timer.start(150 if len(text) >= 5 else 250)
         else:
             self.search_timer.stop()
             self.clear_results()
@@ -134,6 +136,11 @@ class DBCSearchDialog(QDialog):
         if not search_term:
             return
         
+        # Cancel the previous request so stale searches stop burning CPU
+        search_worker = self.threading_manager.dbc_search_worker
+        if self.current_request_id is not None:
+            search_worker.cancel(self.current_request_id)
+        
         # Create search request
         self.current_request_id = str(uuid.uuid4())
         
@@ -158,7 +165,7 @@ class DBCSearchDialog(QDialog):
         self.search_btn.setEnabled(False)
         
         # Execute search in worker thread
-        self.threading_manager.dbc_search_worker.execute_search(search_request)
+        search_worker.execute_search(search_request)
     
     @Slot(str, int, int)
     def on_search_progress(self, request_id: str, current: int, total: int):
@@ -178,51 +185,40 @@ class DBCSearchDialog(QDialog):
         self.progress_bar.setVisible(False)
         self.search_btn.setEnabled(True)
         
-        # Clear existing results
-        self.results_table.setRowCount(0)
+        # Full result data is looked up by row in accept_selection
+        self._last_results = results
+        
+        # Pre-allocate rows and bind hot lookups once outside the loop
+        table = self.results_table
+        table.setRowCount(len(results))
+        set_item = table.setItem
+        Item = QTableWidgetItem
         
         # Populate results
-        for i, result in enumerate(results):
-            self.results_table.insertRow(i)
+        for i, r in enumerate(results):
+            get = r.get
+            result_type = get('type', '')
             
-            # Type
-            type_item = QTableWidgetItem(result.get('type', ''))
-            self.results_table.setItem(i, 0, type_item)
-            
-            # Name
-            name_item = QTableWidgetItem(result.get('name', ''))
-            self.results_table.setItem(i, 1, name_item)
-            
-            # ID
-            id_str = result.get('id', result.get('message_id', ''))
-            id_item = QTableWidgetItem(str(id_str))
-            self.results_table.setItem(i, 2, id_item)
-            
-            # Details
-            if result.get('type') == 'signal':
-                details = f"Bit {result.get('start_bit', 0)}, Len {result.get('length', 0)}"
-                if result.get('unit'):
-                    details += f", Unit: {result.get('unit')}"
-            elif result.get('type') == 'message':
-                details = f"DLC {result.get('dlc', 0)}, {result.get('signals_count', 0)} signals"
+            if result_type == 'signal':
+                details = f"Bit {get('start_bit', 0)}, Len {get('length', 0)}"
+                unit = get('unit')
+                if unit:
+                    details += f", Unit: {unit}"
+            elif result_type == 'message':
+                details = f"DLC {get('dlc', 0)}, {get('signals_count', 0)} signals"
             else:
                 details = ""
             
-            details_item = QTableWidgetItem(details)
-            self.results_table.setItem(i, 3, details_item)
-            
-            # Parent (for signals)
-            parent = result.get('message_name', '')
-            parent_item = QTableWidgetItem(parent)
-            self.results_table.setItem(i, 4, parent_item)
-            
-            # Description
-            description = result.get('comment', '')[:100]  # Truncate long descriptions
-            desc_item = QTableWidgetItem(description)
-            self.results_table.setItem(i, 5, desc_item)
-            
-            # Store full result data in item
-            name_item.setData(Qt.UserRole, result)
+            row = (
+                result_type,
+                get('name', ''),
+                str(get('id', get('message_id', ''))),
+                details,
+                get('message_name', ''),  # Parent (for signals)
+                (get('comment') or '')[:100],  # Truncate long descriptions
+            )
+            for col, text in enumerate(row):
+                set_item(i, col, Item(text))
         
         # Resize columns to content
         self.results_table.resizeColumnsToContents()
@@ -240,6 +236,7 @@ class DBCSearchDialog(QDialog):
     def clear_results(self):
         """Clear search results"""
         self.results_table.setRowCount(0)
+        self._last_results = []
     
     def on_result_selected(self):
         """Handle result double-click"""
@@ -248,14 +245,10 @@ class DBCSearchDialog(QDialog):
     def accept_selection(self):
         """Accept selected result"""
         current_row = self.results_table.currentRow()
-        if current_row >= 0:
-            name_item = self.results_table.item(current_row, 1)
-            if name_item:
-                result_data = name_item.data(Qt.UserRole)
-                if result_data:
-                    self.selection_made.emit(result_data)
-                    self.accept()
-                    return
+        if 0 <= current_row < len(self._last_results):
+            self.selection_made.emit(self._last_results[current_row])
+            self.accept()
+            return
         
         self.reject()
 
@@ -267,6 +260,44 @@ class EnhancedTransmitPanel(QWidget):
     message_transmission_requested = Signal(dict)
     dbc_search_requested = Signal()
     
+    # Panel stylesheet, built once for all instances
+    _STYLE = """
+    QGroupBox {
+        font-weight: bold;
+        border: 2px solid #bdc3c7;
+        border-radius: 6px;
+        margin-top: 1ex;
+        padding-top: 8px;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 5px 0 5px;
+    }
+    QTableWidget {
+        gridline-color: #e0e0e0;
+        selection-background-color: #3498db;
+        alternate-background-color: #f8f9fa;
+    }
+    QPushButton {
+        padding: 6px 12px;
+        border: 1px solid #bdc3c7;
+        border-radius: 4px;
+        background-color: #ecf0f1;
+    }
+    QPushButton:hover {
+        background-color: #d5dbdb;
+    }
+    QPushButton:pressed {
+        background-color: #bdc3c7;
+    }
+    QLineEdit {
+        padding: 4px;
+        border: 1px solid #bdc3c7;
+        border-radius: 3px;
+    }
+    """
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         
@@ -278,6 +309,36 @@ class EnhancedTransmitPanel(QWidget):
         self.current_signals = {}
         self.composition_pending = False
         
+        # Signal name -> value, kept in sync with the signals table
+        self._signal_rows: Dict[str, float] = {}
+        
+        # Reusable signals table items, one list of 6 items per row
+        self._sig_items: List[List[QTableWidgetItem]] = []
+        
+        self._sent_count = 0
+        self._message_name_model = None
+        
+        # Typing in the message ID field loads signals once the user pauses
+        self._pending_msgid = None
+        self._msgid_timer = QTimer(self)
+        self._msgid_timer.setSingleShot(True)
+        self._msgid_timer.timeout.connect(self._apply_pending_msgid)
+        
+        # Status panel updates from composition are coalesced to ~30 Hz
+        self._pending_status = None
+        self._status_timer = QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.setInterval(33)
+        self._status_timer.timeout.connect(self._flush_status)
+        
+        # DBC search dialog is created on first use and reused afterwards
+        self._search_dialog = None
+        
+        # Raw data parsed once per edit (None when the text is not valid hex)
+        self._cached_tx_bytes = b''
+        self._composed_hex = None
+        self._composed_bytes = None
+        
         self.setup_ui()
         self.connect_threading_signals()
         self.apply_professional_style()
@@ -382,6 +443,8 @@ class EnhancedTransmitPanel(QWidget):
         self.signals_table.setColumnWidth(3, 60)   # Min
         self.signals_table.setColumnWidth(4, 60)   # Max
         
+        self.signals_table.itemChanged.connect(self._on_signal_cell_edited)
+        
         signals_layout.addWidget(self.signals_table)
         
         # Composition controls
@@ -417,6 +480,7 @@ class EnhancedTransmitPanel(QWidget):
         self.raw_data_edit = QLineEdit()
         self.raw_data_edit.setPlaceholderText("00 00 00 00 00 00 00 00")
         self.raw_data_edit.setFont(QFont("Consolas", 10))
+        self.raw_data_edit.textChanged.connect(self._on_raw_text_changed)
         raw_layout.addWidget(self.raw_data_edit)
         
         self.dlc_spin = QSpinBox()
@@ -489,17 +553,25 @@ class EnhancedTransmitPanel(QWidget):
     
     def open_dbc_search(self):
         """Open DBC search dialog"""
-        search_dialog = DBCSearchDialog(self.threading_manager, self)
-        search_dialog.selection_made.connect(self.on_dbc_selection_made)
-        search_dialog.show()
+        if self._search_dialog is None:
+            self._search_dialog = DBCSearchDialog(self.threading_manager, self)
+            self._search_dialog.selection_made.connect(self.on_dbc_selection_made)
+        
+        self._search_dialog.search_input.clear()
+        self._search_dialog.clear_results()
+        self._search_dialog.show()
+        self._search_dialog.raise_()
+        self._search_dialog.search_input.setFocus()
     
     @Slot(dict)
     def on_dbc_selection_made(self, selection_data: Dict[str, Any]):
         """Handle DBC search selection"""
+        self._msgid_timer.stop()
         if selection_data.get('type') == 'message':
             # Set message ID
             message_id = selection_data.get('id_decimal', 0)
-            self.message_id_edit.setText(f"0x{message_id:X}")
+            with QSignalBlocker(self.message_id_edit):  # Signals are loaded explicitly below
+                self.message_id_edit.setText(f"0x{message_id:X}")
             self.current_message_id = message_id
             
             # Update message info
@@ -513,7 +585,8 @@ class EnhancedTransmitPanel(QWidget):
         elif selection_data.get('type') == 'signal':
             # Set message ID from signal's parent message
             message_id = selection_data.get('message_id_decimal', 0)
-            self.message_id_edit.setText(f"0x{message_id:X}")
+            with QSignalBlocker(self.message_id_edit):
+                self.message_id_edit.setText(f"0x{message_id:X}")
             self.current_message_id = message_id
             
             # Update message info  
@@ -533,12 +606,19 @@ class EnhancedTransmitPanel(QWidget):
                 message_id = int(text) if text else 0
             
             self.current_message_id = message_id
-            self.load_message_signals(message_id)
+            self._pending_msgid = message_id
+            self._msgid_timer.start(150)
             
         except ValueError:
+            self._msgid_timer.stop()
             self.current_message_id = None
             self.clear_signals_table()
     
+    def _apply_pending_msgid(self):
+        """Load signals for the message ID typed last"""
+        if self._pending_msgid is not None:
+            self.load_message_signals(self._pending_msgid)
+    
     def on_message_combo_changed(self, text: str):
         """Handle message combo selection"""
         # This would be connected to DBC message list
@@ -549,8 +629,6 @@ class EnhancedTransmitPanel(QWidget):
         # This would use the DBC manager to load actual signals
         # For now, we'll create a placeholder implementation
         
-        self.signals_table.setRowCount(0)
-        
         # Placeholder signals (would come from DBC)
         placeholder_signals = [
             {"name": "Engine_RPM", "value": 800, "unit": "rpm", "min": 0, "max": 8000, "desc": "Engine rotation speed"},
@@ -558,63 +636,86 @@ class EnhancedTransmitPanel(QWidget):
             {"name": "Throttle_Pos", "value": 0, "unit": "%", "min": 0, "max": 100, "desc": "Throttle position"},
         ]
         
+        table = self.signals_table
+        table.blockSignals(True)
+        table.setUpdatesEnabled(False)
+        self._signal_rows.clear()
+        
+        # Keep pooled items alive past the new row count, then size the table once
+        self._release_signal_rows(len(placeholder_signals))
+        
+        pool = self._sig_items
         for i, signal in enumerate(placeholder_signals):
-            self.signals_table.insertRow(i)
-            
-            # Signal name
-            name_item = QTableWidgetItem(signal["name"])
-            if highlight_signal and signal["name"] == highlight_signal:
-                name_item.setBackground(QColor(255, 255, 0, 100))  # Yellow highlight
-            self.signals_table.setItem(i, 0, name_item)
+            texts = (signal["name"], str(signal["value"]), signal["unit"],
+                     str(signal["min"]), str(signal["max"]), signal["desc"])
             
-            # Current value (editable)
-            value_item = QTableWidgetItem(str(signal["value"]))
-            value_item.setFlags(value_item.flags() | Qt.ItemIsEditable)
-            self.signals_table.setItem(i, 1, value_item)
-            
-            # Unit
-            unit_item = QTableWidgetItem(signal["unit"])
-            self.signals_table.setItem(i, 2, unit_item)
+            if i < len(pool):
+                row_items = pool[i]
+                for item, text in zip(row_items, texts):
+                    item.setText(text)
+            else:
+                row_items = [QTableWidgetItem(text) for text in texts]
+                # Current value (editable)
+                row_items[1].setFlags(row_items[1].flags() | Qt.ItemIsEditable)
+                pool.append(row_items)
             
-            # Min value
-            min_item = QTableWidgetItem(str(signal["min"]))
-            self.signals_table.setItem(i, 3, min_item)
+            # Re-attach items that were taken out of the table
+            if table.item(i, 0) is not row_items[0]:
+                for col, item in enumerate(row_items):
+                    table.setItem(i, col, item)
             
-            # Max value
-            max_item = QTableWidgetItem(str(signal["max"]))
-            self.signals_table.setItem(i, 4, max_item)
+            # Signal name highlight
+            if highlight_signal and signal["name"] == highlight_signal:
+                row_items[0].setBackground(QColor(255, 255, 0, 100))  # Yellow highlight
+            else:
+                row_items[0].setData(Qt.BackgroundRole, None)
             
-            # Description
-            desc_item = QTableWidgetItem(signal["desc"])
-            self.signals_table.setItem(i, 5, desc_item)
+            self._signal_rows[signal["name"]] = float(signal["value"])
+        
+        table.setUpdatesEnabled(True)
+        table.blockSignals(False)
         
         # Auto-compose if enabled
         if self.auto_compose_cb.isChecked():
             self.compose_message_async()
     
+    def _release_signal_rows(self, row_count: int):
+        """Shrink/grow the signals table to row_count without destroying pooled items"""
+        table = self.signals_table
+        for row in range(row_count, table.rowCount()):
+            for col in range(table.columnCount()):
+                table.takeItem(row, col)
+        table.setRowCount(row_count)
+    
     def clear_signals_table(self):
         """Clear signals table"""
-        self.signals_table.setRowCount(0)
+        self._release_signal_rows(0)
+        self._signal_rows.clear()
         self.message_name_label.setText("Message: -")
         self.dlc_label.setText("DLC: -")
         self.signals_count_label.setText("Signals: -")
     
+    def _on_signal_cell_edited(self, item: QTableWidgetItem):
+        """Track edited signal values"""
+        if item.column() != 1:
+            return
+        
+        name_item = self.signals_table.item(item.row(), 0)
+        if not name_item:
+            return
+        
+        try:
+            self._signal_rows[name_item.text()] = float(item.text())
+        except ValueError:
+            self._signal_rows[name_item.text()] = 0
+    
     def compose_message_async(self):
         """Compose message using worker thread"""
         if not self.current_message_id:
             return
         
-        # Collect signal values from table
-        signal_values = {}
-        for row in range(self.signals_table.rowCount()):
-            name_item = self.signals_table.item(row, 0)
-            value_item = self.signals_table.item(row, 1)
-            
-            if name_item and value_item:
-                try:
-                    signal_values[name_item.text()] = float(value_item.text())
-                except ValueError:
-                    signal_values[name_item.text()] = 0
+        # Signal values are tracked as cells are edited
+        signal_values = dict(self._signal_rows)
         
         # Show composition progress
         self.composition_progress.setVisible(True)
@@ -643,24 +744,38 @@ class EnhancedTransmitPanel(QWidget):
         self.composition_pending = False
         
         # Update raw data display
-        data_bytes = composed_message.get('data', b'\\x00' * 8)
-        data_hex = ' '.join([f"{b:02X}" for b in data_bytes])
+        data_bytes = bytes(composed_message.get('data', b'\x00' * 8))
+        data_hex = data_bytes.hex(" ").upper()
+        self._composed_hex = data_hex
+        self._composed_bytes = data_bytes
         self.raw_data_edit.setText(data_hex)
         
         # Update DLC
         self.dlc_spin.setValue(composed_message.get('dlc', 8))
         
-        # Update status
-        self.status_label.setText("Message composed ✅")
-        self.status_label.setStyleSheet("color: #27ae60; font-weight: bold;")
+        # Update status (coalesced, see _flush_status)
+        self._pending_status = ("Message composed ✅", "#27ae60")
+        if not self._status_timer.isActive():
+            self._status_timer.start()
         
         print(f"✅ Message composed: ID=0x{self.current_message_id:X}, Data={data_hex}")
     
+    def _set_status(self, text: str, color: Optional[str] = None):
+        """Show a status immediately, dropping any coalesced one still pending"""
+        self._pending_status = None
+        self.status_label.setText(text)
+        if color is not None:
+            self.status_label.setStyleSheet(f"color: {color}; font-weight: bold;")
+    
+    def _flush_status(self):
+        """Push the latest pending status to the status panel"""
+        if self._pending_status is not None:
+            self._set_status(*self._pending_status)
+    
     @Slot(str, str)
     def on_transmission_error(self, message_id: str, error_message: str):
         """Handle transmission error"""
-        self.status_label.setText(f"Error: {error_message}")
-        self.status_label.setStyleSheet("color: #e74c3c; font-weight: bold;")
+        self._set_status(f"Error: {error_message}", "#e74c3c")
         print(f"❌ Transmission error: {error_message}")
     
     def reset_signal_values(self):
@@ -673,17 +788,30 @@ class EnhancedTransmitPanel(QWidget):
         if self.auto_compose_cb.isChecked():
             self.compose_message_async()
     
+    def _on_raw_text_changed(self, text: str):
+        """Parse raw data once per edit and flag invalid hex"""
+        if text == self._composed_hex:
+            # Text came from the last composition - reuse its bytes
+            self._cached_tx_bytes = self._composed_bytes
+        else:
+            try:
+                self._cached_tx_bytes = bytes.fromhex(text.replace(' ', ''))
+            except ValueError:
+                self._cached_tx_bytes = None
+        
+        style = "" if self._cached_tx_bytes is not None else "border: 1px solid #e74c3c;"
+        if self.raw_data_edit.styleSheet() != style:
+            self.raw_data_edit.setStyleSheet(style)
+    
     def send_message_once(self):
         """Send message once"""
         if not self.current_message_id:
             return
         
-        # Parse raw data
-        try:
-            data_text = self.raw_data_edit.text().replace(' ', '')
-            data_bytes = bytes.fromhex(data_text)
-        except ValueError:
-            data_bytes = b'\\x00' * 8
+        data_bytes = self._cached_tx_bytes
+        if data_bytes is None:
+            self._set_status("Invalid raw data ❌", "#e74c3c")
+            return
         
         # Create transmission request
         transmission_data = {
@@ -695,11 +823,11 @@ class EnhancedTransmitPanel(QWidget):
         }
         
         self.message_transmission_requested.emit(transmission_data)
-        self.status_label.setText("Message sent ✅")
+        self._set_status("Message sent ✅")
         
         # Update sent counter
-        current_count = int(self.sent_count_label.text().split(': ')[1])
-        self.sent_count_label.setText(f"Sent: {current_count + 1}")
+        self._sent_count += 1
+        self.sent_count_label.setText(f"Sent: {self._sent_count}")
     
     def start_periodic_transmission(self):
         """Start periodic message transmission"""
@@ -720,8 +848,7 @@ class EnhancedTransmitPanel(QWidget):
         # Update UI state
         self.start_periodic_btn.setEnabled(False)
         self.stop_periodic_btn.setEnabled(True)
-        self.status_label.setText("Periodic transmission active 🔄")
-        self.status_label.setStyleSheet("color: #f39c12; font-weight: bold;")
+        self._set_status("Periodic transmission active 🔄", "#f39c12")
         
         print(f"▶️ Started periodic transmission: ID=0x{self.current_message_id:X}, Interval={self.interval_spin.value()}ms")
     
@@ -733,55 +860,35 @@ class EnhancedTransmitPanel(QWidget):
         # Update UI state
         self.start_periodic_btn.setEnabled(True)
         self.stop_periodic_btn.setEnabled(False)
-        self.status_label.setText("Periodic transmission stopped ⏹️")
-        self.status_label.setStyleSheet("color: #e74c3c; font-weight: bold;")
+        self._set_status("Periodic transmission stopped ⏹️", "#e74c3c")
         
         print("⏹️ Stopped periodic transmission")
     
     def set_dbc_manager(self, dbc_manager):
         """Set DBC manager and update worker threads"""
         self.threading_manager.set_dbc_manager(dbc_manager)
+        self.update_message_completer(dbc_manager)
         print("🔄 DBC manager updated in transmit panel")
     
+    def update_message_completer(self, dbc_manager):
+        """Drive message_combo completion from a sorted name model (binary-search prefix matching)"""
+        database = getattr(dbc_manager, 'database', None) or getattr(dbc_manager, 'active_database', None)
+        names = sorted((message.name for message in database.messages), key=str.lower) if database else []
+        
+        if self._message_name_model is None:
+            self._message_name_model = QStringListModel(self)
+            completer = QCompleter(self._message_name_model, self)
+            completer.setCaseSensitivity(Qt.CaseInsensitive)
+            completer.setFilterMode(Qt.MatchStartsWith)
+            completer.setModelSorting(QCompleter.CaseInsensitivelySortedModel)
+            completer.setCompletionMode(QCompleter.PopupCompletion)
+            self.message_combo.setCompleter(completer)
+        
+        self._message_name_model.setStringList(names)
+    
     def apply_professional_style(self):
         """Apply professional styling"""
-        style = """
-        QGroupBox {
-            font-weight: bold;
-            border: 2px solid #bdc3c7;
-            border-radius: 6px;
-            margin-top: 1ex;
-            padding-top: 8px;
-        }
-        QGroupBox::title {
-            subcontrol-origin: margin;
-            left: 10px;
-            padding: 0 5px 0 5px;
-        }
-        QTableWidget {
-            gridline-color: #e0e0e0;
-            selection-background-color: #3498db;
-            alternate-background-color: #f8f9fa;
-        }
-        QPushButton {
-            padding: 6px 12px;
-            border: 1px solid #bdc3c7;
-            border-radius: 4px;
-            background-color: #ecf0f1;
-        }
-        QPushButton:hover {
-            background-color: #d5dbdb;
-        }
-        QPushButton:pressed {
-            background-color: #bdc3c7;
-        }
-        QLineEdit {
-            padding: 4px;
-            border: 1px solid #bdc3c7;
-            border-radius: 3px;
-        }
-        """
-        self.setStyleSheet(style)
+        self.setStyleSheet(self._STYLE)
     
     def closeEvent(self, event):
         """Clean shutdown"""
@@ -8,21 +8,128 @@ import glob
 import platform
 import subprocess
 import re
+import sys
+import shutil
+import json
+import math
+import heapq
+import bisect
+import itertools
+import time
+import logging
+from functools import lru_cache, partial
+from collections import namedtuple
+from contextlib import contextmanager
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
                                QComboBox, QRadioButton, QPushButton, QLineEdit,
-                               QCheckBox, QSpinBox, QGroupBox, QFormLayout,
+                               QCheckBox, QSpinBox, QGroupBox, QFormLayout, QGridLayout,
                                QButtonGroup, QFrame, QScrollArea, QTabWidget,
                                QTableWidget, QListWidget, QToolBar,
                                QAbstractItemView, QTableWidgetItem, QCheckBox,
                                QSlider, QProgressBar, QTextEdit, QSplitter, 
-                               QDialog, QDialogButtonBox, QHeaderView)
-from PySide6.QtCore import Signal, Qt, QTimer, QSize
-from PySide6.QtGui import QFont, QValidator, QRegularExpressionValidator, QIcon, QIntValidator, QColor
+                               QDialog, QDialogButtonBox, QHeaderView, QTableView,
+                               QStyledItemDelegate, QStyle, QStyleOptionButton, QStyleOptionViewItem,
+                               QApplication)
+from PySide6.QtCore import (Signal, Qt, QTimer, QSize, QSignalBlocker, QThreadPool,
+                            QAbstractTableModel, QModelIndex, SIGNAL, QEvent, QLocale)
+from PySide6.QtGui import QFont, QValidator, QRegularExpressionValidator, QIcon, QIntValidator, QDoubleValidator, QColor, QTextCursor
 from can_backend import CANBusManager
-from dataclasses import dataclass
-import copy
+from dataclasses import dataclass, field, fields
 
-@dataclass
+try:
+    import serial.tools.list_ports
+    PYSERIAL_AVAILABLE = True
+except ImportError:
+    PYSERIAL_AVAILABLE = False
+
+log = logging.getLogger(__name__)
+
+# CAN-related keywords in serial port descriptions (can, canable, cantact, usb2can, slcan, ...)
+_CAN_KW_RE = re.compile(r'can(?:able|tact)?|usb2can|slcan|peak|kvaser', re.IGNORECASE)
+
+# Resolved once; device info queries are skipped when the tool is missing
+_IP_BIN = shutil.which("ip")
+_UDEVADM_BIN = shutil.which("udevadm")
+
+# Plain network interface names; anything else is never used to build a sysfs path
+_IFACE_NAME_RE = re.compile(r'[A-Za-z0-9_.-]+')
+
+# Byte translation table for the ASCII column of hex dumps
+_PRINTABLE_TABLE = bytes(b if 32 <= b <= 126 else ord('.') for b in range(256))
+
+# Hardware drivers that address the device by numeric channel
+_DRIVERS_WITH_CHANNEL = frozenset({"vector", "pcan", "kvaser", "ixxat"})
+
+# Signals editor table columns
+_SIG_COL_NAME, _SIG_COL_VALUE, _SIG_COL_UNIT, _SIG_COL_DESC = 0, 1, 2, 3
+
+# Per-signal metadata the signals editor needs; invariant for a loaded DBC
+_SignalView = namedtuple('_SignalView', 'name choices unit comment')
+
+# Slotted dataclasses need Python 3.10+; older interpreters fall back to __dict__
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+def _parse_data_bytes(data):
+    """Parse space-separated data bytes (hex with or without 0x, decimal fallback) to bytes."""
+    # Fast path for the canonical "11 22 33" form written by the dialog and signal encoder
+    if len(data) % 3 == 2 and data[2::3] == ' ' * (len(data) // 3):
+        try:
+            return bytes.fromhex(data)
+        except ValueError:
+            pass
+    values = []
+    for byte_str in data.split():
+        # Handle both hex (with/without 0x) and decimal
+        try:
+            values.append(int(byte_str, 16))
+        except ValueError:
+            values.append(int(byte_str))
+    return bytes(v & 0xFF for v in values)
+
+# Background of active TX rows ("lightgreen"), built once instead of per data() call
+_ACTIVE_BG = QColor(144, 238, 144)
+
+# TX dialog DBC combo labels: {id(dbc_msg): (dbc_msg, label)}; the message is kept so its id can't be reused
+_DBC_LABEL_CACHE = {}
+
+def clear_dbc_label_cache():
+    """Forget cached DBC message labels, e.g. after a DBC file is (re)loaded."""
+    _DBC_LABEL_CACHE.clear()
+
+def _dbc_message_label(msg_id, dbc_msg):
+    """Return the TX dialog combo label for a DBC message, built once per message object."""
+    entry = _DBC_LABEL_CACHE.get(id(dbc_msg))
+    if entry is not None and entry[0] is dbc_msg:
+        return entry[1]
+    label = f"{getattr(dbc_msg, 'name', f'Message_{msg_id}')} (ID: 0x{msg_id:X}, DLC: {getattr(dbc_msg, 'length', 8)})"
+    _DBC_LABEL_CACHE[id(dbc_msg)] = (dbc_msg, label)
+    return label
+
+# Base of a typed message ID by its prefix; anything unprefixed is decimal
+_ID_TEXT_BASES = {'0x': 16, '0X': 16, '0b': 2}
+
+def _parse_id_text(text):
+    """Parse a typed message ID ("0x1A", "0b11010" or "26") to an int; raises ValueError."""
+    return int(text, _ID_TEXT_BASES.get(text[:2], 10))
+
+# TX dialog DBC messages with more signals than this get a virtualized signal table
+_SIGNAL_VIRTUALIZE_THRESHOLD = 50
+
+# Prebuilt table labels for the common small signal counts
+_SIGNAL_LABELS = ("No signals",) + tuple(f"{i} signals" for i in range(1, 65))
+
+@lru_cache(maxsize=None)
+def _control_text(rtr, extended_id, fd, brs, esi):
+    """Build the control bits label once per flag combination."""
+    control_bits = []
+    if rtr: control_bits.append("RTR")
+    if extended_id: control_bits.append("EXT")
+    if fd: control_bits.append("FD")
+    if brs: control_bits.append("BRS")
+    if esi: control_bits.append("ESI")
+    return ", ".join(control_bits) if control_bits else "STD"
+
+@dataclass(**_DATACLASS_SLOTS)
 class TxMessage:
     """Data class for a transmit message."""
     msg_id: str
@@ -40,10 +147,300 @@ class TxMessage:
     fd: bool = False  # CAN-FD frame
     brs: bool = False  # Bit Rate Switch (CAN-FD)
     esi: bool = False  # Error State Indicator (CAN-FD)
+    # Parsed form of data, valid while data is still the string it was parsed from
+    _data_src: str = field(default=None, init=False, repr=False, compare=False)
+    _data_bytes: bytes = field(default=b"", init=False, repr=False, compare=False)
+    # Payload sized to dlc, valid while built from the same parsed bytes and dlc
+    _payload_src: bytes = field(default=None, init=False, repr=False, compare=False)
+    _payload_dlc: int = field(default=-1, init=False, repr=False, compare=False)
+    _payload: tuple = field(default=(), init=False, repr=False, compare=False)
+    # Last backend send dict, reused while ID, payload and flags are unchanged
+    _message_data: dict = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self):
         if self.dbc_signals is None:
             self.dbc_signals = {}
+    
+    def data_bytes(self):
+        """Return data as bytes, parsing the text only when it has been reassigned."""
+        if self.data is not self._data_src:
+            self._data_bytes = _parse_data_bytes(self.data)
+            self._data_src = self.data
+        return self._data_bytes
+    
+    def payload(self):
+        """Return data zero-padded or truncated to dlc as a tuple of ints, rebuilt only after edits."""
+        data_bytes = self.data_bytes()
+        if data_bytes is not self._payload_src or self.dlc != self._payload_dlc:
+            self._payload = tuple(data_bytes.ljust(self.dlc, b"\x00")[:self.dlc])
+            self._payload_src = data_bytes
+            self._payload_dlc = self.dlc
+        return self._payload
+    
+    def message_data(self, msg_id):
+        """Return the backend send dict for this message; receivers must treat it as read-only."""
+        payload = self.payload()
+        message_data = self._message_data
+        if (message_data is None or message_data['data'] is not payload or message_data['id'] != msg_id
+                or message_data['fd'] != self.fd or message_data['brs'] != self.brs
+                or message_data['esi'] != self.esi):
+            message_data = self._message_data = {
+                'id': msg_id,
+                'dlc': self.dlc,
+                'data': payload,
+                'extended': msg_id > 0x7FF,  # Auto-detect extended ID
+                'fd': self.fd,  # Include CAN FD flag
+                'brs': self.brs,  # Include Bit Rate Switch flag
+                'esi': self.esi,  # Include Error State Indicator flag
+            }
+        return message_data
+    
+    def diff(self, other):
+        """Return the names of the fields whose values differ from other."""
+        return {f.name for f in fields(self)
+                if f.compare and getattr(self, f.name) != getattr(other, f.name)}
+    
+    def set_data_bytes(self, values):
+        """Set data from byte values, formatting the hex text once and keeping the bytes."""
+        self._data_bytes = bytes(v & 0xFF for v in values)
+        self.data = self._data_src = self._data_bytes.hex(' ').upper()
+    
+    @property
+    def control_text(self):
+        """Control bits summary for display, e.g. "EXT, FD" or "STD"."""
+        return _control_text(self.rtr, self.extended_id, self.fd, self.brs, self.esi)
+    
+    @property
+    def signals_text(self):
+        """Signal count summary for display."""
+        signals_count = len(self.dbc_signals) if self.dbc_signals else 0
+        if signals_count < len(_SIGNAL_LABELS):
+            return _SIGNAL_LABELS[signals_count]
+        return f"{signals_count} signals"
+
+class TxMessagesModel(QAbstractTableModel):
+    """Table model exposing a list of TxMessage objects to the transmit table view."""
+    
+    HEADERS = ["Send", "ID", "DBC Name", "DLC", "Data", "Period (ms)", "Count", "Sent", "Control", "Signals"]
+    COL_SEND, COL_ID, COL_DBC_NAME, COL_DLC, COL_DATA, COL_PERIOD, COL_COUNT, COL_SENT, COL_CONTROL, COL_SIGNALS = range(10)
+    # Column showing each TxMessage field (is_active also tints the whole row)
+    FIELD_COLUMNS = {
+        'is_active': COL_SEND, 'msg_id': COL_ID, 'dbc_name': COL_DBC_NAME, 'dlc': COL_DLC,
+        'data': COL_DATA, 'cycle_ms': COL_PERIOD, 'count': COL_COUNT, 'total_sent': COL_SENT,
+        'rtr': COL_CONTROL, 'extended_id': COL_CONTROL, 'fd': COL_CONTROL, 'brs': COL_CONTROL,
+        'esi': COL_CONTROL, 'dbc_signals': COL_SIGNALS,
+    }
+    
+    # Emitted when the user toggles a row's Send checkbox: (row, checked)
+    active_toggled = Signal(int, bool)
+    
+    def __init__(self, messages, parent=None):
+        super().__init__(parent)
+        self._msgs = messages  # Shared with the sidebar; it stays the backing store
+    
+    def set_messages(self, messages):
+        """Replace the backing list and reset attached views."""
+        self.beginResetModel()
+        self._msgs = messages
+        self.endResetModel()
+    
+    def reset(self):
+        """Tell attached views the backing list changed shape (rows added or removed)."""
+        self.beginResetModel()
+        self.endResetModel()
+    
+    def refresh_row(self, row, first=0, last=None, roles=()):
+        """Repaint columns first..last of one row, optionally for the given roles only."""
+        if last is None:
+            last = len(self.HEADERS) - 1
+        self.dataChanged.emit(self.index(row, first), self.index(row, last), list(roles))
+    
+    def refresh_fields(self, row, changed):
+        """Repaint the narrowest column range of one row covering the changed fields."""
+        if 'is_active' in changed:
+            self.refresh_row(row)
+            return
+        cols = [self.FIELD_COLUMNS[name] for name in changed if name in self.FIELD_COLUMNS]
+        if cols:
+            self.refresh_row(row, min(cols), max(cols))
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._msgs)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+    
+    def flags(self, index):
+        flags = Qt.ItemIsEnabled | Qt.ItemIsSelectable
+        if index.column() == self.COL_SEND:
+            flags |= Qt.ItemIsUserCheckable
+        return flags
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or index.row() >= len(self._msgs):
+            return None
+        msg = self._msgs[index.row()]
+        col = index.column()
+        
+        if role == Qt.DisplayRole:
+            if col == self.COL_ID:
+                return str(msg.msg_id)
+            if col == self.COL_DBC_NAME:
+                return msg.dbc_name if msg.dbc_name else "N/A"
+            if col == self.COL_DLC:
+                return str(msg.dlc)
+            if col == self.COL_DATA:
+                return msg.data
+            if col == self.COL_PERIOD:
+                return str(msg.cycle_ms) if msg.cycle_ms > 0 else 'Manual'
+            if col == self.COL_COUNT:
+                return str(msg.count) if msg.count > 0 else '∞'
+            if col == self.COL_SENT:
+                return str(msg.total_sent)
+            if col == self.COL_CONTROL:
+                return msg.control_text
+            if col == self.COL_SIGNALS:
+                return msg.signals_text
+            return None
+        
+        if role == Qt.CheckStateRole and col == self.COL_SEND:
+            return Qt.Checked if msg.is_active else Qt.Unchecked
+        
+        if role == Qt.BackgroundRole and msg.is_active:
+            # Color code active rows
+            return _ACTIVE_BG
+        
+        return None
+    
+    def setData(self, index, value, role=Qt.EditRole):
+        if role == Qt.CheckStateRole and index.isValid() and index.column() == self.COL_SEND:
+            # The sidebar owns activation (it also drives the periodic timers)
+            self.active_toggled.emit(index.row(), Qt.CheckState(value) == Qt.Checked)
+            return True
+        return False
+
+class TxActiveDelegate(QStyledItemDelegate):
+    """Paints the Send column's check state as a centered checkbox and toggles it on click."""
+    
+    def _indicator_rect(self, style, option):
+        size = QSize(style.pixelMetric(QStyle.PM_IndicatorWidth),
+                     style.pixelMetric(QStyle.PM_IndicatorHeight))
+        return QStyle.alignedRect(option.direction, Qt.AlignCenter, size, option.rect)
+    
+    def paint(self, painter, option, index):
+        opt = QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        style = opt.widget.style() if opt.widget else QApplication.style()
+        # Background and selection as usual, then the indicator on top
+        opt.features &= ~QStyleOptionViewItem.HasCheckIndicator
+        style.drawControl(QStyle.CE_ItemViewItem, opt, painter, opt.widget)
+        
+        check = QStyleOptionButton()
+        check.rect = self._indicator_rect(style, option)
+        check.state = QStyle.State_Enabled
+        check.state |= QStyle.State_On if index.data(Qt.CheckStateRole) == Qt.Checked else QStyle.State_Off
+        style.drawPrimitive(QStyle.PE_IndicatorCheckBox, check, painter, opt.widget)
+    
+    def editorEvent(self, event, model, option, index):
+        if not index.flags() & Qt.ItemIsUserCheckable:
+            return False
+        if event.type() == QEvent.MouseButtonRelease:
+            if event.button() != Qt.LeftButton or not option.rect.contains(event.position().toPoint()):
+                return False
+        elif event.type() == QEvent.MouseButtonDblClick:
+            return True  # Swallow so a double click toggles twice rather than three times
+        elif event.type() == QEvent.KeyPress:
+            if event.key() not in (Qt.Key_Space, Qt.Key_Select):
+                return False
+        else:
+            return False
+        
+        checked = index.data(Qt.CheckStateRole) == Qt.Checked
+        return model.setData(index, Qt.Unchecked if checked else Qt.Checked, Qt.CheckStateRole)
+
+class TxSignalValuesModel(QAbstractTableModel):
+    """Signal name/value rows of one DBC message, backed by the TX dialog's signal values dict."""
+    
+    HEADERS = ("Signal", "Value")
+    COL_NAME, COL_VALUE = range(len(HEADERS))
+    
+    # Emitted when the user commits an edit: (signal, text)
+    value_edited = Signal(object, str)
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._signals = []
+        self._values = {}
+    
+    def set_signals(self, signals, values):
+        """Show the given signals; values is read live, keyed by signal name."""
+        self.beginResetModel()
+        self._signals = list(signals)
+        self._values = values
+        self.endResetModel()
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._signals)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+    
+    def flags(self, index):
+        flags = Qt.ItemIsEnabled | Qt.ItemIsSelectable
+        if index.column() == self.COL_VALUE:
+            flags |= Qt.ItemIsEditable
+        return flags
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or index.row() >= len(self._signals):
+            return None
+        signal = self._signals[index.row()]
+        
+        if role in (Qt.DisplayRole, Qt.EditRole):
+            if index.column() == self.COL_NAME:
+                unit = getattr(signal, 'unit', None)
+                return f"{signal.name} ({unit})" if unit else signal.name
+            return str(self._values.get(signal.name, 0))
+        
+        if role == Qt.ToolTipRole:
+            tooltip_parts = []
+            if hasattr(signal, 'minimum') and hasattr(signal, 'maximum'):
+                tooltip_parts.append(f"Range: {signal.minimum} to {signal.maximum}")
+            if getattr(signal, 'unit', None):
+                tooltip_parts.append(f"Unit: {signal.unit}")
+            if getattr(signal, 'comment', None):
+                tooltip_parts.append(f"Comment: {signal.comment}")
+            return "\n".join(tooltip_parts)
+        
+        return None
+    
+    def setData(self, index, value, role=Qt.EditRole):
+        if role == Qt.EditRole and index.isValid() and index.column() == self.COL_VALUE:
+            # The dialog owns clamping and encoding; it writes the values dict back
+            self.value_edited.emit(self._signals[index.row()], str(value))
+            self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.EditRole])
+            return True
+        return False
+
+class TxSignalValueDelegate(QStyledItemDelegate):
+    """Creates a numeric QLineEdit for the signal value cell being edited."""
+    
+    def createEditor(self, parent, option, index):
+        editor = QLineEdit(parent)
+        validator = QDoubleValidator(editor)
+        validator.setLocale(QLocale.c())  # Values go through float()
+        editor.setValidator(validator)
+        return editor
 
 class AdvancedLeftSidebar(QScrollArea):
     """Advanced left sidebar with comprehensive CAN functionality"""
@@ -54,6 +451,7 @@ class AdvancedLeftSidebar(QScrollArea):
     
     # Message signals
     send_message = Signal(dict)
+    send_messages_batch = Signal(list)  # Periodic messages due in the same scheduler tick
     start_periodic = Signal(dict)
     stop_periodic = Signal(str)  # Message ID
     
@@ -61,6 +459,49 @@ class AdvancedLeftSidebar(QScrollArea):
     interface_changed = Signal(str)
     bitrate_changed = Signal(int)
     
+    # Signal editor rows built on the thread pool: (generation, dbc message, row specs)
+    _signal_rows_ready = Signal(int, object, object)
+    
+    DETECT_CACHE_TTL = 2.0  # Seconds before device detection results go stale
+    SIGNAL_DEBOUNCE_MS = 150  # Delay before typed interface/bitrate text is emitted
+    SIGNAL_ROWS_ASYNC_THRESHOLD = 64  # Signal count above which editor rows are prepared off the GUI thread
+    
+    # Stylesheets applied repeatedly, parsed from one shared string each
+    _CONNECTED_QSS = """
+        QLabel {
+            padding: 8px;
+            background-color: #e8f5e8;
+            border: 1px solid #4caf50;
+            border-radius: 4px;
+            color: #2e7d32;
+            font-weight: bold;
+        }
+    """
+    _DISCONNECTED_QSS = """
+        QLabel {
+            padding: 8px;
+            background-color: #ffebee;
+            border: 1px solid #ef5350;
+            border-radius: 4px;
+            color: #c62828;
+            font-weight: bold;
+        }
+    """
+    # Set once on the signals table; value combos pick it up by parentage
+    _COMBO_QSS = """
+        QTableWidget QComboBox {
+            padding: 2px 4px;
+            border: 1px solid #ccc;
+        }
+        QTableWidget QComboBox::drop-down {
+            width: 15px;
+        }
+        QTableWidget QComboBox QAbstractItemView {
+            font-size: 9pt;
+            selection-background-color: #3daee9;
+        }
+    """
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.periodic_timers = {}  # Track periodic sending: {row_index: QTimer}
@@ -68,53 +509,151 @@ class AdvancedLeftSidebar(QScrollArea):
         self.dbc_manager = None
         self.dbc_message_cache = {}  # Cache DBC messages to avoid repeated lookups
         self.dbc_cache_valid = False  # Track if cache is valid
+        self._fresh_dbc_ids = set()  # IDs re-resolved since the cache went stale
+        self._signal_view_cache = {}  # Signal metadata: {msg_id_int: (dbc_msg, [_SignalView])}
+        self._detect_cache = {}  # Device detection results: {(system, kind): [devices]}
+        self._detect_cache_ts = {}  # Detection timestamps: {(system, kind): monotonic time}
+        self._usb_info_cache = {}  # USB device info by device path
+        self._iface_info_cache = {}  # SocketCAN info: {interface: (monotonic time, info)}
+        # Coalesce raw data keystrokes/pastes into one hex viewer refresh
+        self._hex_refresh_timer = QTimer(self)
+        self._hex_refresh_timer.setSingleShot(True)
+        self._hex_refresh_timer.setInterval(50)
+        self._hex_refresh_timer.timeout.connect(self._refresh_hex_viewer)
+        # Re-index the DBC cache once the event loop is idle after a full invalidation
+        self._dbc_rebuild_timer = QTimer(self)
+        self._dbc_rebuild_timer.setSingleShot(True)
+        self._dbc_rebuild_timer.timeout.connect(self._rebuild_stale_dbc_cache)
+        self._last_hex_bytes = None  # Bytes currently shown in the hex viewer, None if it shows a message
+        self._pending_row_updates = set()  # TX table rows to redraw on the next event-loop turn
+        self._row_flush_scheduled = False
+        self._last_encoded_signals = {}  # {row: ((ID, DBC, signals), data) of the last encode}
+        self._signal_rows_generation = 0  # Bumped per signals table population
+        self._selected_row_cache = None  # First selected TX row, kept current by on_tx_selection_changed
+        self._last_btn_state = None  # (has_selection, has_messages) last applied to the TX buttons
+        self._status_dirty = False  # TX status labels/buttons need a refresh on the next event-loop turn
+        # Table fonts, created once and shared by the tables and their cell editors
+        self._tx_table_font = QFont()
+        self._tx_table_font.setPointSize(8)
+        self._signals_font = QFont()
+        self._signals_font.setPointSize(9)
+        self._signal_rows_ready.connect(self._on_signal_rows_ready)
         self.setup_ui()
         self.apply_modern_style()
+
+    def invalidate_dbc_cache(self, ids=None):
+        """Invalidate DBC cache when DBC file changes; entries are re-resolved lazily until
+        the deferred rebuild restores the full index."""
+        if ids is not None:
+            # Precise invalidation: only drop the affected entries
+            for msg_id in ids:
+                self.dbc_message_cache.pop(msg_id, None)
+                self._signal_view_cache.pop(msg_id, None)
+                self._fresh_dbc_ids.discard(msg_id)
+            return
+        self.dbc_cache_valid = False
+        self._fresh_dbc_ids.clear()
+        self._signal_view_cache.clear()
+        self._last_encoded_signals.clear()
+        clear_dbc_label_cache()
+        self._dbc_rebuild_timer.start()
+        log.debug("DBC cache invalidated")
     
-    def invalidate_dbc_cache(self):
-        """Invalidate DBC cache when DBC file changes."""
+    def _rebuild_stale_dbc_cache(self):
+        """Rebuild the DBC cache if it is still stale, bringing back the indexed fast path."""
+        if not self.dbc_cache_valid:
+            self.rebuild_dbc_cache()
+    
+    def purge_dbc_cache(self):
+        """Drop every cached DBC message, e.g. when the DBC file is unloaded."""
         self.dbc_message_cache.clear()
+        self._fresh_dbc_ids.clear()
+        self._signal_view_cache.clear()
+        self._last_encoded_signals.clear()
         self.dbc_cache_valid = False
-        print("[DEBUG] DBC cache invalidated")
+        self._dbc_rebuild_timer.stop()  # Nothing left to index
+        clear_dbc_label_cache()
     
     def get_dbc_message_cached(self, msg_id):
         """Get DBC message with caching to avoid repeated lookups."""
         if not self.dbc_manager:
             return None
+        
+        # Fast path: integer frame IDs that are already cached
+        if type(msg_id) is int and self.dbc_cache_valid:
+            dbc_msg = self.dbc_message_cache.get(msg_id)
+            if dbc_msg is not None:
+                return dbc_msg
             
         # Parse message ID to integer
-        try:
-            if isinstance(msg_id, str):
-                if msg_id.startswith(('0x', '0X')):
-                    msg_id_int = int(msg_id, 16)
-                else:
-                    msg_id_int = int(msg_id, 16)  # Assume hex
-            else:
+        if isinstance(msg_id, str):
+            msg_id_int = self._parse_msg_id(msg_id)
+        else:
+            try:
                 msg_id_int = int(msg_id)
-        except (ValueError, TypeError):
-            print(f"[DEBUG] Failed to parse message ID: {msg_id}")
+            except (ValueError, TypeError):
+                msg_id_int = None
+        if msg_id_int is None:
+            log.debug("Failed to parse message ID: %r", msg_id)
             return None
         
-        # Rebuild cache if invalid
-        if not self.dbc_cache_valid:
+        # Build the cache on first use; after an invalidation, stale entries refresh one at a time
+        # until the deferred rebuild (see invalidate_dbc_cache) re-indexes everything
+        if not self.dbc_cache_valid and not self.dbc_message_cache:
             self.rebuild_dbc_cache()
         
         # Check cache first
-        if self.dbc_cache_valid and msg_id_int in self.dbc_message_cache:
-            print(f"[DEBUG] Cache hit for ID 0x{msg_id_int:X}")
-            return self.dbc_message_cache[msg_id_int]
+        if self.dbc_cache_valid or msg_id_int in self._fresh_dbc_ids:
+            if msg_id_int in self.dbc_message_cache:
+                if log.isEnabledFor(logging.DEBUG):
+                    log.debug("Cache hit for ID 0x%X", msg_id_int)
+                return self.dbc_message_cache[msg_id_int]
+            if not self.dbc_cache_valid:
+                # Already re-resolved and not present in the current DBC
+                return None
         
         # If not in cache, try fallback lookup directly from DBC manager
-        print(f"[DEBUG] Cache miss for ID 0x{msg_id_int:X}, trying direct lookup")
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Cache miss for ID 0x%X, trying direct lookup", msg_id_int)
         dbc_msg = self._direct_dbc_lookup(msg_id_int)
         
-        # If found via direct lookup, add to cache
+        # If found via direct lookup, add to cache (overwriting any stale entry)
         if dbc_msg:
             self.dbc_message_cache[msg_id_int] = dbc_msg
-            print(f"[DEBUG] Added ID 0x{msg_id_int:X} to cache via direct lookup")
+            log.debug("Added ID 0x%X to cache via direct lookup", msg_id_int)
+        else:
+            self.dbc_message_cache.pop(msg_id_int, None)
+        if not self.dbc_cache_valid:
+            self._fresh_dbc_ids.add(msg_id_int)
         
         return dbc_msg
     
+    def get_signal_views(self, msg_id_int, dbc_msg):
+        """Return the cached signal metadata list for a DBC message, building it on first use."""
+        cached = self._signal_view_cache.get(msg_id_int)
+        if cached is not None and cached[0] is dbc_msg:
+            return cached[1]
+        views = [
+            _SignalView(signal.name,
+                        tuple(signal.choices.items()) if getattr(signal, 'choices', None) else (),
+                        getattr(signal, 'unit', '') or '',
+                        getattr(signal, 'comment', '') or '')
+            for signal in dbc_msg.signals
+        ]
+        self._signal_view_cache[msg_id_int] = (dbc_msg, views)
+        return views
+    
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _parse_msg_id(msg_id):
+        """Parse a message ID (int, or hex string with or without 0x) to an int, or None"""
+        if isinstance(msg_id, int):
+            return msg_id
+        try:
+            return int(msg_id, 16)
+        except (ValueError, TypeError):
+            return None
+    
     def _direct_dbc_lookup(self, msg_id_int):
         """Direct DBC lookup fallback when cache misses."""
         try:
@@ -135,18 +674,16 @@ class AdvancedLeftSidebar(QScrollArea):
                     except (KeyError, ValueError, AttributeError):
                         pass
                 
-                # Try searching through messages manually
-                if hasattr(db, 'messages'):
-                    for message in db.messages:
-                        frame_id = getattr(message, 'frame_id', None)
-                        if frame_id == msg_id_int:
-                            return message
+            # Fall back to the frame ID index instead of scanning messages. A stale index is
+            # not rebuilt here: the caller records the miss for this ID only.
+            if self.dbc_cache_valid and msg_id_int in self.dbc_message_cache:
+                return self.dbc_message_cache[msg_id_int]
             
-            print(f"[DEBUG] Direct lookup failed for ID 0x{msg_id_int:X}")
+            log.debug("Direct lookup failed for ID 0x%X", msg_id_int)
             return None
             
         except Exception as e:
-            print(f"[DEBUG] Error in direct DBC lookup for ID 0x{msg_id_int:X}: {e}")
+            log.debug("Error in direct DBC lookup for ID 0x%X: %s", msg_id_int, e)
             return None
     
     def rebuild_dbc_cache(self):
@@ -168,16 +705,17 @@ class AdvancedLeftSidebar(QScrollArea):
                     messages = db.messages
             
             # Cache all messages by their frame ID
-            for msg in messages:
-                frame_id = getattr(msg, 'frame_id', None)
-                if frame_id is not None:
-                    self.dbc_message_cache[frame_id] = msg
+            self.dbc_message_cache = {
+                frame_id: msg for msg in messages
+                if (frame_id := getattr(msg, 'frame_id', None)) is not None
+            }
             
             self.dbc_cache_valid = True
-            print(f"[DEBUG] DBC cache rebuilt with {len(self.dbc_message_cache)} messages")
+            self._fresh_dbc_ids.clear()
+            log.debug("DBC cache rebuilt with %s messages", len(self.dbc_message_cache))
             
         except Exception as e:
-            print(f"[DEBUG] Error rebuilding DBC cache: {e}")
+            log.debug("Error rebuilding DBC cache: %s", e)
             self.dbc_cache_valid = False
         
     def setup_ui(self):
@@ -192,13 +730,16 @@ class AdvancedLeftSidebar(QScrollArea):
         bus_config_tab = self.setup_bus_config_tab()
         self.tab_widget.addTab(bus_config_tab, "🔧 Bus Config")
 
-        # Transmit Tab (CAN IG)
-        transmit_tab = self.setup_transmit_tab()
-        self.tab_widget.addTab(transmit_tab, "📤 Transmit")
+        # Transmit Tab (CAN IG) - widgets are built on first activation
+        self._transmit_tab_built = False
+        self._transmit_placeholder = QWidget()
+        placeholder_layout = QVBoxLayout(self._transmit_placeholder)
+        placeholder_layout.setContentsMargins(0, 0, 0, 0)
+        self.tab_widget.addTab(self._transmit_placeholder, "📤 Transmit")
+        self.tab_widget.currentChanged.connect(self._ensure_transmit_tab_built)
 
-        # Initialize model and populate table AFTER UI is created
+        # Initialize model now; the table is populated when the tab is built
         self._init_tx_model()
-        self.populate_tx_table()
 
         layout.addWidget(self.tab_widget)
         # Set the widget for the scroll area
@@ -207,6 +748,16 @@ class AdvancedLeftSidebar(QScrollArea):
         self.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
         self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
 
+    def _ensure_transmit_tab_built(self, index=None):
+        """Build the transmit tab widgets the first time the tab is shown"""
+        if self._transmit_tab_built:
+            return
+        if index is not None and self.tab_widget.widget(index) is not self._transmit_placeholder:
+            return
+        self._transmit_tab_built = True
+        self._transmit_placeholder.layout().addWidget(self.setup_transmit_tab())
+        self.populate_tx_table()
+
     def setup_bus_config_tab(self):
         tab = QWidget()
         layout = QVBoxLayout(tab)
@@ -236,7 +787,13 @@ class AdvancedLeftSidebar(QScrollArea):
         self.refresh_interfaces_btn = QPushButton("🔄")
         self.refresh_interfaces_btn.setToolTip("Refresh available interfaces")
         self.refresh_interfaces_btn.setMaximumWidth(30)
-        self.refresh_interfaces_btn.clicked.connect(self._refresh_interfaces)
+        self.refresh_interfaces_btn.clicked.connect(self.force_refresh_interfaces)
+        
+        # Picking an entry emits right away; typed text is debounced
+        self._interface_timer = QTimer(self)
+        self._interface_timer.setSingleShot(True)
+        self._interface_timer.setInterval(self.SIGNAL_DEBOUNCE_MS)
+        self._interface_timer.timeout.connect(self._apply_interface_change)
         
         interface_widget_layout.addWidget(self.interface_combo, 1)
         interface_widget_layout.addWidget(self.refresh_interfaces_btn)
@@ -244,7 +801,7 @@ class AdvancedLeftSidebar(QScrollArea):
         interface_layout.addRow("Interface:", interface_widget)
         
         # Populate initial interfaces
-        self._refresh_interfaces()
+        self._refresh_interfaces(notify=False)
         
         # Channel number (for drivers that need it)
         self.channel_spin = QSpinBox()
@@ -253,12 +810,14 @@ class AdvancedLeftSidebar(QScrollArea):
         
         # Store reference to the channel row for show/hide
         self.channel_row_index = interface_layout.rowCount() - 1
+        self.channel_label = interface_layout.labelForField(self.channel_spin)
         
         # USB Device Info (for SLCAN devices)
         self.device_info_label = QLabel("")
         self.device_info_label.setStyleSheet("color: #666; font-style: italic; font-size: 8pt;")
         self.device_info_label.setWordWrap(True)
         interface_layout.addRow("Device Info:", self.device_info_label)
+        self.interface_combo.currentTextChanged.connect(self._on_interface_changed)
         
         layout.addWidget(interface_group)
         
@@ -292,9 +851,11 @@ class AdvancedLeftSidebar(QScrollArea):
             "83.333", "125", "250", "500", "800", "1000"
         ])
         self.bitrate_combo.setCurrentText("500")
-        self.bitrate_combo.currentTextChanged.connect(
-            lambda x: self.bitrate_changed.emit(int(float(x) * 1000))
-        )
+        self._bitrate_timer = QTimer(self)
+        self._bitrate_timer.setSingleShot(True)
+        self._bitrate_timer.setInterval(self.SIGNAL_DEBOUNCE_MS)
+        self._bitrate_timer.timeout.connect(self._emit_bitrate_changed)
+        self.bitrate_combo.currentTextChanged.connect(self._bitrate_timer.start)
         can_layout.addRow("Nominal Bitrate (kbps):", self.bitrate_combo)
         
         # Data bitrate for CAN FD
@@ -349,16 +910,7 @@ class AdvancedLeftSidebar(QScrollArea):
         
         # Status display
         self.connection_status = QLabel("🔴 Disconnected")
-        self.connection_status.setStyleSheet("""
-            QLabel {
-                padding: 8px;
-                background-color: #ffebee;
-                border: 1px solid #ef5350;
-                border-radius: 4px;
-                color: #c62828;
-                font-weight: bold;
-            }
-        """)
+        self.connection_status.setStyleSheet(self._DISCONNECTED_QSS)
         connection_layout.addWidget(self.connection_status)
         
         # Buttons
@@ -387,49 +939,28 @@ class AdvancedLeftSidebar(QScrollArea):
     
     def _on_driver_changed(self, driver_text):
         """Handle driver selection change to update interface options"""
-        print(f"[DEBUG] Driver changed to: {driver_text}")
+        log.debug("Driver changed to: %s", driver_text)
         self._refresh_interfaces()
         self._update_ui_for_driver(driver_text)
     
     def _update_ui_for_driver(self, driver):
         """Update UI elements based on selected driver"""
         # Show/hide channel field based on driver
-        if driver in ["vector", "pcan", "kvaser", "ixxat"]:
-            self.channel_spin.setVisible(True)
-            # Try to get the label widget and show it
-            if hasattr(self, 'channel_row_index'):
-                try:
-                    layout = self.channel_spin.parent().layout()
-                    if hasattr(layout, 'itemAt') and self.channel_row_index < layout.rowCount():
-                        label_item = layout.itemAt(self.channel_row_index, QFormLayout.LabelRole)
-                        if label_item and label_item.widget():
-                            label_item.widget().setVisible(True)
-                except:
-                    pass
-        else:
-            self.channel_spin.setVisible(False)
-            # Try to hide the label widget
-            if hasattr(self, 'channel_row_index'):
-                try:
-                    layout = self.channel_spin.parent().layout()
-                    if hasattr(layout, 'itemAt') and self.channel_row_index < layout.rowCount():
-                        label_item = layout.itemAt(self.channel_row_index, QFormLayout.LabelRole)
-                        if label_item and label_item.widget():
-                            label_item.widget().setVisible(False)
-                except:
-                    pass
+        show_channel = driver in _DRIVERS_WITH_CHANNEL
+        self.channel_spin.setVisible(show_channel)
+        if self.channel_label:
+            self.channel_label.setVisible(show_channel)
         
         # Update interface selection based on current choice
         current_interface = self.interface_combo.currentText()
         if current_interface and driver != "auto-detect":
             self._update_device_info(current_interface, driver)
     
-    def _refresh_interfaces(self):
+    def _refresh_interfaces(self, notify=True):
         """Refresh available interfaces based on selected driver"""
         driver = self.driver_combo.currentText()
         current_selection = self.interface_combo.currentText()
         
-        self.interface_combo.clear()
         interfaces = []
         
         # Determine which interfaces to show based on driver and platform
@@ -441,35 +972,35 @@ class AdvancedLeftSidebar(QScrollArea):
                 # On Windows, prioritize SLCAN devices
                 slcan_devices = self._detect_slcan_devices()
                 interfaces.extend(slcan_devices)
-                print(f"[DEBUG] Auto-detect on Windows: Found SLCAN devices: {slcan_devices}")
+                log.debug("Auto-detect on Windows: Found SLCAN devices: %s", slcan_devices)
             else:
                 # On Linux/macOS, show both SLCAN and SocketCAN
                 slcan_devices = self._detect_slcan_devices()
                 socketcan_devices = self._detect_socketcan_interfaces()
                 interfaces.extend(slcan_devices)
                 interfaces.extend(socketcan_devices)
-                print(f"[DEBUG] Auto-detect on {system}: Found SLCAN: {slcan_devices}, SocketCAN: {socketcan_devices}")
+                log.debug("Auto-detect on %s: Found SLCAN: %s, SocketCAN: %s", system, slcan_devices, socketcan_devices)
                 
         elif driver == "slcan":
             # SLCAN only: detect serial devices on all platforms
             slcan_devices = self._detect_slcan_devices()
             interfaces.extend(slcan_devices)
-            print(f"[DEBUG] SLCAN driver: Found devices: {slcan_devices}")
+            log.debug("SLCAN driver: Found devices: %s", slcan_devices)
             
         elif driver == "socketcan":
             # SocketCAN only: only on Linux
             if system == "Linux":
                 socketcan_devices = self._detect_socketcan_interfaces()
                 interfaces.extend(socketcan_devices)
-                print(f"[DEBUG] SocketCAN driver on Linux: Found devices: {socketcan_devices}")
+                log.debug("SocketCAN driver on Linux: Found devices: %s", socketcan_devices)
             else:
-                print(f"[DEBUG] SocketCAN driver not supported on {system}")
+                log.debug("SocketCAN driver not supported on %s", system)
                 interfaces = []  # No interfaces available
                 
-        elif driver in ["vector", "pcan", "kvaser", "ixxat"]:
+        elif driver in _DRIVERS_WITH_CHANNEL:
             # Hardware drivers: use numeric channels
             interfaces = [str(i) for i in range(0, 8)]
-            print(f"[DEBUG] Hardware driver {driver}: Using channels 0-7")
+            log.debug("Hardware driver %s: Using channels 0-7", driver)
         
         # Add fallback options if no interfaces detected
         if not interfaces:
@@ -481,34 +1012,51 @@ class AdvancedLeftSidebar(QScrollArea):
                     interfaces.insert(0, "--- Type manually if not listed ---")
                 else:
                     interfaces.extend(["/dev/ttyACM0", "/dev/ttyUSB0"])
-                print(f"[DEBUG] Using SLCAN fallback interfaces for {system}")
+                log.debug("Using SLCAN fallback interfaces for %s", system)
             elif driver == "socketcan" and system == "Linux":
                 # Fallback for SocketCAN on Linux only
                 interfaces.extend(["can0", "can1", "vcan0"])
-                print(f"[DEBUG] Using SocketCAN fallback interfaces")
+                log.debug("Using SocketCAN fallback interfaces")
         
-        self.interface_combo.addItems(interfaces)
+        # Repopulate without firing per-item change signals
+        with QSignalBlocker(self.interface_combo):
+            self.interface_combo.clear()
+            self.interface_combo.addItems(interfaces)
+            
+            # Restore previous selection if available
+            if current_selection and current_selection in interfaces:
+                self.interface_combo.setCurrentText(current_selection)
         
-        # Restore previous selection if available
-        if current_selection and current_selection in interfaces:
-            self.interface_combo.setCurrentText(current_selection)
+        # Notify once if the refresh changed the selection
+        new_selection = self.interface_combo.currentText()
+        if notify and new_selection != current_selection:
+            self._apply_interface_change()
         
-        # Connect signal after population
+        log.debug("Populated %s interfaces for driver %s on %s", len(interfaces), driver, system)
+        log.debug("Available interfaces: %s", interfaces)
+    
+    def _emit_bitrate_changed(self):
+        """Emit bitrate_changed once the bitrate text has settled"""
         try:
-            self.interface_combo.currentTextChanged.disconnect()
-        except (TypeError, RuntimeError):
-            # Signal was not connected, which is fine
-            pass
-        self.interface_combo.currentTextChanged.connect(self._on_interface_changed)
-        self.interface_combo.currentTextChanged.connect(self.interface_changed.emit)
-        
-        print(f"[DEBUG] Populated {len(interfaces)} interfaces for driver {driver} on {system}")
-        print(f"[DEBUG] Available interfaces: {interfaces}")
+            bitrate = int(float(self.bitrate_combo.currentText()) * 1000)
+        except ValueError:
+            return  # Partial or invalid input
+        self.bitrate_changed.emit(bitrate)
     
     def _on_interface_changed(self, interface):
         """Handle interface selection change"""
-        driver = self.driver_combo.currentText()
-        self._update_device_info(interface, driver)
+        if self.interface_combo.findText(interface) < 0:
+            # Typed text: wait for it to settle
+            self._interface_timer.start()
+            return
+        self._apply_interface_change()
+    
+    def _apply_interface_change(self):
+        """Update device info and emit interface_changed for the current interface"""
+        self._interface_timer.stop()
+        interface = self.interface_combo.currentText()
+        self._update_device_info(interface, self.driver_combo.currentText())
+        self.interface_changed.emit(interface)
     
     def _update_device_info(self, interface, driver):
         """Update device information display"""
@@ -541,41 +1089,50 @@ class AdvancedLeftSidebar(QScrollArea):
         
         self.device_info_label.setText(info_text)
     
+    def force_refresh_interfaces(self):
+        """Drop cached detection results and rescan interfaces"""
+        self._detect_cache.clear()
+        self._detect_cache_ts.clear()
+        self._usb_info_cache.clear()
+        self._iface_info_cache.clear()
+        self._refresh_interfaces()
+    
+    def _cached_detection(self, kind, scan):
+        """Return recent detection results for kind, rescanning once they expire"""
+        key = (platform.system(), kind)
+        now = time.monotonic()
+        if key in self._detect_cache and now - self._detect_cache_ts[key] < self.DETECT_CACHE_TTL:
+            return list(self._detect_cache[key])
+        devices = scan()
+        self._detect_cache[key] = devices
+        self._detect_cache_ts[key] = now
+        return list(devices)
+    
     def _detect_slcan_devices(self):
+        """Detect potential SLCAN serial devices, reusing recent results"""
+        return self._cached_detection("slcan", self._scan_slcan_devices)
+    
+    def _detect_socketcan_interfaces(self):
+        """Detect available SocketCAN interfaces, reusing recent results"""
+        return self._cached_detection("socketcan", self._scan_socketcan_interfaces)
+    
+    def _scan_slcan_devices(self):
         """Detect potential SLCAN serial devices with USB-to-CAN identification"""
         slcan_candidates = []
         system = platform.system()
         
         try:
             if system == "Linux":
-                # Linux serial device patterns with priority for USB devices
-                patterns = [
-                    "/dev/serial/by-id/*CAN*",      # CAN devices by ID (priority)
-                    "/dev/serial/by-id/*can*",      # CAN devices by ID lowercase
-                    "/dev/serial/by-id/*CANable*",  # CANable devices specifically
-                    "/dev/ttyACM*",                 # USB-CDC devices (CANable, etc.)
-                    "/dev/ttyUSB*",                 # FTDI/CH340 USB-Serial adapters
-                ]
-                
-                for pattern in patterns:
-                    for device in glob.glob(pattern):
-                        if os.access(device, os.R_OK | os.W_OK):
-                            # Resolve symlinks for by-id devices
-                            real_device = os.path.realpath(device) if "/by-id/" in device else device
-                            if real_device not in slcan_candidates:
-                                slcan_candidates.append(real_device)
-                
-                # If no USB-CAN specific devices found, add generic USB serial
-                if not slcan_candidates:
-                    for pattern in ["/dev/ttyACM*", "/dev/ttyUSB*"]:
-                        for device in glob.glob(pattern):
-                            if os.access(device, os.R_OK | os.W_OK):
-                                slcan_candidates.append(device)
+                # CAN devices by ID first, then USB-CDC and USB-serial adapters
+                for device in self._scan_dev_serial():
+                    if os.access(device, os.R_OK | os.W_OK):
+                        # Resolve symlinks for by-id devices
+                        real_device = os.path.realpath(device) if "/by-id/" in device else device
+                        slcan_candidates.append(real_device)
                 
             elif system == "Windows":
                 # Windows COM ports - enhanced detection for CANable and other CAN devices
-                try:
-                    import serial.tools.list_ports
+                if PYSERIAL_AVAILABLE:
                     ports = serial.tools.list_ports.comports()
                     
                     # Prioritize CAN-related devices but include ALL available COM ports
@@ -584,16 +1141,14 @@ class AdvancedLeftSidebar(QScrollArea):
                     
                     for port in ports:
                         description = (port.description or '').lower()
-                        manufacturer = (getattr(port, 'manufacturer', '') or '').lower()
-                        product = (getattr(port, 'product', '') or '').lower()
+                        manufacturer = getattr(port, 'manufacturer', '') or ''
+                        product = getattr(port, 'product', '') or ''
                         vid = getattr(port, 'vid', None)
                         pid = getattr(port, 'pid', None)
                         hwid = (getattr(port, 'hwid', '') or '').upper()
                         
                         # Check for CAN-related keywords in descriptions
-                        can_keywords = ['can', 'canable', 'cantact', 'usb2can', 'slcan', 'peak', 'kvaser']
-                        has_can_keyword = any(keyword in description or keyword in manufacturer or keyword in product 
-                                            for keyword in can_keywords)
+                        has_can_keyword = bool(_CAN_KW_RE.search(f"{description} {manufacturer} {product}"))
                         
                         # Check for known CAN device VID/PID combinations
                         known_can_devices = [
@@ -612,7 +1167,10 @@ class AdvancedLeftSidebar(QScrollArea):
                         # Classify as CAN device if any criteria match
                         if has_can_keyword or is_known_can_device or is_canable_hwid:
                             can_devices.append(port.device)
-                            print(f"[DEBUG] Identified CAN device: {port.device} - {description} (VID:0x{vid:04X}, PID:0x{pid:04X})" if vid and pid else f"[DEBUG] Identified CAN device: {port.device} - {description}")
+                            if vid and pid:
+                                log.debug("Identified CAN device: %s - %s (VID:0x%04X, PID:0x%04X)", port.device, description, vid, pid)
+                            else:
+                                log.debug("Identified CAN device: %s - %s", port.device, description)
                         else:
                             other_devices.append(port.device)
                     
@@ -620,10 +1178,10 @@ class AdvancedLeftSidebar(QScrollArea):
                     slcan_candidates.extend(can_devices)
                     slcan_candidates.extend(other_devices)
                     
-                    print(f"[DEBUG] Windows COM detection: Found {len(can_devices)} CAN devices, {len(other_devices)} other devices")
+                    log.debug("Windows COM detection: Found %s CAN devices, %s other devices", len(can_devices), len(other_devices))
                     
-                except ImportError:
-                    print("[DEBUG] pyserial not available, using fallback COM port detection")
+                else:
+                    log.debug("pyserial not available, using fallback COM port detection")
                     # Comprehensive fallback - scan all COM ports 1-50
                     slcan_candidates = [f"COM{i}" for i in range(1, 51)]
                     
@@ -648,61 +1206,75 @@ class AdvancedLeftSidebar(QScrollArea):
                 slcan_candidates = ["/dev/cu.usbmodem1", "/dev/cu.usbserial1"]
         
         # Remove duplicates while preserving order
-        unique_candidates = []
-        for device in slcan_candidates:
-            if device not in unique_candidates:
-                unique_candidates.append(device)
+        unique_candidates = list(dict.fromkeys(slcan_candidates))
         
-        print(f"[DEBUG] Detected SLCAN candidates: {unique_candidates}")
+        log.debug("Detected SLCAN candidates: %s", unique_candidates)
         return unique_candidates
     
-    def _detect_socketcan_interfaces(self):
+    @staticmethod
+    def _scan_dev_serial():
+        """List Linux serial device candidates with one directory scan per location"""
+        by_id, acm, usb = [], [], []
+        try:
+            with os.scandir("/dev/serial/by-id") as entries:
+                by_id = sorted(entry.path for entry in entries if "can" in entry.name.lower())
+        except OSError:
+            pass
+        try:
+            with os.scandir("/dev") as entries:
+                for entry in entries:
+                    if entry.name.startswith("ttyACM"):
+                        acm.append(entry.path)
+                    elif entry.name.startswith("ttyUSB"):
+                        usb.append(entry.path)
+        except OSError:
+            pass
+        return by_id + sorted(acm) + sorted(usb)
+    
+    def _scan_socketcan_interfaces(self):
         """Detect available SocketCAN interfaces (Linux only)"""
         # Only detect SocketCAN interfaces on Linux
         if platform.system() != "Linux":
-            print("[DEBUG] SocketCAN not supported on non-Linux systems")
+            log.debug("SocketCAN not supported on non-Linux systems")
             return []
             
         try:
-            # Import the CAN manager to use its detection method
-            interfaces = CANBusManager.list_socketcan_interfaces()
-            if not interfaces:
-                # Fallback detection
-                import glob
+            # CAN and virtual CAN interfaces are listed directly in sysfs
+            interfaces = sorted(name for name in os.listdir("/sys/class/net")
+                                if name.startswith(("can", "vcan")))
+        except OSError:
+            # No sysfs (e.g. restricted container): ask the backend instead
+            try:
+                interfaces = CANBusManager.list_socketcan_interfaces()
+            except Exception as e:
+                print(f"[WARNING] Error detecting SocketCAN interfaces: {e}")
                 interfaces = []
-                # Check /sys/class/net for CAN interfaces
-                for interface_path in glob.glob("/sys/class/net/can*"):
-                    interface_name = os.path.basename(interface_path)
-                    interfaces.append(interface_name)
-                # Also check for vcan interfaces
-                for interface_path in glob.glob("/sys/class/net/vcan*"):
-                    interface_name = os.path.basename(interface_path)
-                    interfaces.append(interface_name)
-                    
-                # If still nothing, add common defaults only on Linux
-                if not interfaces:
-                    interfaces = ["can0", "can1", "vcan0"]
-                    
-        except Exception as e:
-            print(f"[WARNING] Error detecting SocketCAN interfaces: {e}")
-            # Only provide defaults on Linux
+        
+        # If still nothing, add common defaults only on Linux
+        if not interfaces:
             interfaces = ["can0", "can1", "vcan0"]
             
-        return interfaces
+        return list(dict.fromkeys(interfaces))
     
     def _get_usb_device_info(self, device_path):
-        """Get USB device information for a serial device"""
+        """Get USB device information for a serial device, cached by path"""
+        if device_path not in self._usb_info_cache:
+            self._usb_info_cache[device_path] = self._query_usb_device_info(device_path)
+        return self._usb_info_cache[device_path]
+    
+    def _query_usb_device_info(self, device_path):
+        """Query USB device information for a serial device"""
         try:
-            import platform
             system = platform.system()
             
             if system == "Linux":
+                if _UDEVADM_BIN is None:
+                    return None
                 # Try to get info from udev or sysfs
-                import subprocess
                 try:
                     # Use udevadm to get device info
                     result = subprocess.run(
-                        ["udevadm", "info", "--name", device_path], 
+                        [_UDEVADM_BIN, "info", "--name", device_path], 
                         capture_output=True, text=True, timeout=2
                     )
                     if result.returncode == 0:
@@ -729,8 +1301,7 @@ class AdvancedLeftSidebar(QScrollArea):
                     
             elif system == "Windows":
                 # Use serial.tools.list_ports for Windows with enhanced CANable detection
-                try:
-                    import serial.tools.list_ports
+                if PYSERIAL_AVAILABLE:
                     ports = serial.tools.list_ports.comports()
                     for port in ports:
                         if port.device == device_path:
@@ -762,52 +1333,75 @@ class AdvancedLeftSidebar(QScrollArea):
                                 'pid': pid,
                                 'hwid': hwid
                             }
-                except ImportError:
-                    pass
                     
         except Exception as e:
-            print(f"[DEBUG] Could not get USB info for {device_path}: {e}")
+            log.debug("Could not get USB info for %s: %s", device_path, e)
             
         return None
     
     def _get_socketcan_info(self, interface):
-        """Get SocketCAN interface information"""
+        """Get SocketCAN interface information, reusing recent results"""
+        now = time.monotonic()
+        cached = self._iface_info_cache.get(interface)
+        if cached and now - cached[0] < self.DETECT_CACHE_TTL:
+            return cached[1]
+        info = self._query_socketcan_info(interface)
+        self._iface_info_cache[interface] = (now, info)
+        return info
+    
+    def _query_socketcan_info(self, interface):
+        """Query SocketCAN status and bitrate from sysfs, falling back to a single ip call"""
+        # The name comes from an editable combo: keep the reads inside /sys/class/net
+        if (not _IFACE_NAME_RE.fullmatch(interface) or interface in ('.', '..')
+                or os.sep in interface):
+            log.debug("Ignoring invalid interface name: %r", interface)
+            return None
+        sys_path = os.path.join('/sys/class/net', interface)
+        try:
+            with open(os.path.join(sys_path, 'flags')) as f:
+                status = "UP" if int(f.read(), 16) & 0x1 else "DOWN"  # IFF_UP
+            with open(os.path.join(sys_path, 'type')) as f:
+                is_can = int(f.read()) == 280  # ARPHRD_CAN
+        except (OSError, ValueError):
+            status = None
+        if status is not None:
+            if not is_can:
+                # Only CAN devices have a bitrate, so there is nothing to ask ip for
+                return {'status': status, 'bitrate': None}
+            try:
+                with open(os.path.join(sys_path, 'can_bittiming', 'bitrate')) as f:
+                    return {'status': status, 'bitrate': f.read().strip() or None}
+            except OSError:
+                pass  # Bit timing is only exposed over netlink on most kernels
+        return self._query_socketcan_info_ip(interface)
+    
+    def _query_socketcan_info_ip(self, interface):
+        """Query SocketCAN status and bitrate with a single ip call"""
+        if _IP_BIN is None:
+            return None
         try:
-            import subprocess
-            # Get interface status
             result = subprocess.run(
-                ["ip", "link", "show", interface], 
-                capture_output=True, text=True, timeout=2
+                [_IP_BIN, "-details", "-json", "link", "show", interface], 
+                capture_output=True, timeout=1
             )
             if result.returncode == 0:
-                output = result.stdout
-                status = "UP" if "UP" in output else "DOWN"
+                # json.loads accepts the raw bytes, so skip the text decode
+                links = json.loads(result.stdout)
+                if not links:
+                    return None
+                link = links[0]
+                status = "UP" if "UP" in link.get('flags', []) else "DOWN"
                 
-                # Try to get bitrate info
-                bitrate = None
-                try:
-                    result = subprocess.run(
-                        ["ip", "-details", "link", "show", interface], 
-                        capture_output=True, text=True, timeout=2
-                    )
-                    if result.returncode == 0:
-                        for line in result.stdout.split('\n'):
-                            if 'bitrate' in line:
-                                # Extract bitrate value
-                                import re
-                                match = re.search(r'bitrate (\d+)', line)
-                                if match:
-                                    bitrate = match.group(1)
-                                break
-                except:
-                    pass
+                # Bitrate is only reported for configured CAN devices
+                bittiming = link.get('linkinfo', {}).get('info_data', {}).get('bittiming', {})
+                bitrate = bittiming.get('bitrate')
                     
                 return {
                     'status': status,
-                    'bitrate': bitrate
+                    'bitrate': str(bitrate) if bitrate is not None else None
                 }
         except Exception as e:
-            print(f"[DEBUG] Could not get SocketCAN info for {interface}: {e}")
+            log.debug("Could not get SocketCAN info for %s: %s", interface, e)
             
         return None
 
@@ -868,10 +1462,12 @@ class AdvancedLeftSidebar(QScrollArea):
 
         ig_layout.addWidget(toolbar)
 
-        # Create table with enhanced columns
-        self.tx_table = QTableWidget(0, 10)
-        headers = ["Send", "ID", "DBC Name", "DLC", "Data", "Period (ms)", "Count", "Sent", "Control", "Signals"]
-        self.tx_table.setHorizontalHeaderLabels(headers)
+        # Create table with enhanced columns; cells are served by the model from tx_messages
+        self.tx_model = TxMessagesModel(self.tx_messages, self)
+        self.tx_model.active_toggled.connect(self.update_message_active_state)
+        self.tx_table = QTableView()
+        self.tx_table.setModel(self.tx_model)
+        self.tx_table.setItemDelegateForColumn(TxMessagesModel.COL_SEND, TxActiveDelegate(self.tx_table))
         
         # Set compact table properties
         self.tx_table.verticalHeader().setVisible(False)
@@ -880,10 +1476,10 @@ class AdvancedLeftSidebar(QScrollArea):
         self.tx_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
         
         # Set compact font and row height for better space usage
-        table_font = QFont()
-        table_font.setPointSize(8)  # Smaller font size
-        self.tx_table.setFont(table_font)
+        self.tx_table.setFont(self._tx_table_font)  # Smaller font size
         self.tx_table.verticalHeader().setDefaultSectionSize(22)  # Compact row height
+        # Fixed row heights: the view never measures row contents when rows are added
+        self.tx_table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
         
         # Set optimized column widths for compact display
         header = self.tx_table.horizontalHeader()
@@ -953,7 +1549,7 @@ class AdvancedLeftSidebar(QScrollArea):
         self.send_all_btn.clicked.connect(self.send_all_once)
         
         # Table selection change
-        self.tx_table.selectionModel().selectionChanged.connect(self.update_button_states)
+        self.tx_table.selectionModel().selectionChanged.connect(self._schedule_status_update)
         self.tx_table.selectionModel().selectionChanged.connect(self.on_tx_selection_changed)
 
         return tab
@@ -961,8 +1557,11 @@ class AdvancedLeftSidebar(QScrollArea):
     def set_dbc_manager(self, dbc_manager):
         """Set the DBC manager for this sidebar"""
         self.dbc_manager = dbc_manager
-        self.invalidate_dbc_cache()
-        print("[DEBUG] DBC manager set and cache invalidated")
+        if dbc_manager is None:
+            self.purge_dbc_cache()
+        else:
+            self.invalidate_dbc_cache()
+        log.debug("DBC manager set and cache invalidated")
 
     def create_tx_editor_section(self):
         """Create the lower section for editing selected TX message (CANoe-style)."""
@@ -1035,12 +1634,12 @@ class AdvancedLeftSidebar(QScrollArea):
         self.signals_table.setHorizontalHeaderLabels(["Signal", "Value", "Unit", "Description"])
         
         # Set compact table properties for signals table
-        signals_font = QFont()
-        signals_font.setPointSize(9)  # Slightly larger font for better dropdown readability
-        self.signals_table.setFont(signals_font)
+        self.signals_table.setFont(self._signals_font)  # Slightly larger font for better dropdown readability
         self.signals_table.verticalHeader().setVisible(False)
         self.signals_table.verticalHeader().setDefaultSectionSize(26)  # Increased row height for dropdown widgets
         self.signals_table.setAlternatingRowColors(True)
+        self.signals_table.setStyleSheet(self._COMBO_QSS)
+        self._signals_table_msg = None  # DBC message whose signal rows are shown
         
         # Optimize column sizing for signals table
         signals_header = self.signals_table.horizontalHeader()
@@ -1088,10 +1687,11 @@ class AdvancedLeftSidebar(QScrollArea):
 
     def on_tx_selection_changed(self):
         """Handle TX table selection change to update the editor."""
-        selected_rows = self.tx_table.selectionModel().selectedRows()
+        selection = self.tx_table.selectionModel().selection()
+        row = selection[0].top() if not selection.isEmpty() else None
+        self._selected_row_cache = row
         
-        if selected_rows:
-            row = selected_rows[0].row()
+        if row is not None:
             if row < len(self.tx_messages):
                 # Check if we're selecting the same message that's already being edited
                 if hasattr(self, 'current_editing_row') and self.current_editing_row == row:
@@ -1108,135 +1708,81 @@ class AdvancedLeftSidebar(QScrollArea):
     
     def load_message_in_editor(self, msg, row_index):
         """Load a message into the editor section."""
-        print(f"[DEBUG] Loading message in editor: row {row_index}, ID {msg.msg_id}")
+        log.debug("Loading message in editor: row %s, ID %s", row_index, msg.msg_id)
         self.current_editing_row = row_index
-        # Store a copy of the original message state for revert functionality
-        self.original_message_data = copy.deepcopy(msg) if hasattr(msg, '__dict__') else msg
-        
-        # Temporarily disconnect signals to prevent recursive updates
-        try:
-            self.signals_table.itemChanged.disconnect()
-        except:
-            pass  # May not be connected yet
-        
-        # Update message info
-        self.selected_msg_id_label.setText(str(msg.msg_id))
-        self.selected_msg_dlc_label.setText(str(msg.dlc))
-        self.selected_msg_name_label.setText(msg.dbc_name if msg.dbc_name else "N/A")
+        # Snapshot the fields revert restores (update this tuple if TxMessage grows editable fields)
+        self.original_message_data = (msg.msg_id, msg.dlc, msg.data,
+                                      dict(msg.dbc_signals) if msg.dbc_signals else {}, msg.dbc_name)
         
-        # Update raw data
-        self.raw_data_edit.setText(msg.data)
-        self.update_hex_viewer(msg.data)
-        
-        # Update signals table if DBC signals exist
-        self.populate_signals_table(msg)
-        
-        # Reconnect signals
-        self.signals_table.itemChanged.connect(self.on_signal_value_changed)
+        # Block table signals while loading to prevent recursive updates
+        with QSignalBlocker(self.signals_table):
+            # Update message info
+            self.selected_msg_id_label.setText(str(msg.msg_id))
+            self.selected_msg_dlc_label.setText(str(msg.dlc))
+            self.selected_msg_name_label.setText(msg.dbc_name if msg.dbc_name else "N/A")
+            
+            # Update raw data
+            self.raw_data_edit.setText(msg.data)
+            self.update_hex_viewer(msg.data)
+            
+            # Update signals table if DBC signals exist (ID already parsed in the mirror)
+            msg_id_int = self.tx_message_id(row_index) if row_index < len(self._tx_ids_int) else None
+            self.populate_signals_table(msg, msg_id_int)
         
         # Reset button states
         self.apply_changes_btn.setEnabled(False)
         self.revert_changes_btn.setEnabled(False)
         
-        print(f"[DEBUG] Message loaded in editor successfully")
+        log.debug("Message loaded in editor successfully")
     
-    def populate_signals_table(self, msg):
+    def populate_signals_table(self, msg, msg_id_int=None):
         """Populate the signals table with DBC signal data."""
+        self._signal_rows_generation += 1  # Discard rows still being built for a previous message
+        if msg_id_int is None:
+            msg_id_int = self._parse_msg_id(msg.msg_id)
+        # Same DBC layout as the rows already shown: reuse the widgets, refresh values
+        dbc_msg = self.get_dbc_message_cached(msg_id_int if msg_id_int is not None else msg.msg_id) if self.dbc_manager else None
+        if dbc_msg is not None and dbc_msg is self._signals_table_msg:
+            self._refresh_signal_values(dbc_msg, msg)
+            return
+        self._signals_table_msg = None
+        
         # Clear table content gently to prevent UI artifacts
         self.signals_table.clearContents()
         self.signals_table.setRowCount(0)
         
-        # Temporarily disable updates to prevent flickering
-        self.signals_table.setUpdatesEnabled(False)
-        
         if not self.dbc_manager:
-            print("[DEBUG] No DBC manager available")
+            log.debug("No DBC manager available")
             return
         
+        # Temporarily disable updates and itemChanged while cells are written
+        self.signals_table.setUpdatesEnabled(False)
+        was_blocked = self.signals_table.blockSignals(True)
+        
         # Get DBC message definition using cached lookup
         try:
-            # Parse message ID first (needed for both success and error cases)
-            msg_id_int = None
-            try:
-                if isinstance(msg.msg_id, str):
-                    if msg.msg_id.startswith(('0x', '0X')):
-                        msg_id_int = int(msg.msg_id, 16)
-                    else:
-                        msg_id_int = int(msg.msg_id, 16)
-                else:
-                    msg_id_int = int(msg.msg_id)
-            except (ValueError, TypeError):
+            # Message ID is needed for both success and error cases
+            if msg_id_int is None:
                 msg_id_int = 0  # Default fallback
             
-            dbc_msg = self.get_dbc_message_cached(msg.msg_id)
-            
             if dbc_msg:
-                print(f"[DEBUG] Found cached DBC message with ID: 0x{msg_id_int:X}")
+                log.debug("Found cached DBC message with ID: 0x%X", msg_id_int)
             
             if dbc_msg and hasattr(dbc_msg, 'signals'):
-                print(f"[DEBUG] Found DBC message '{getattr(dbc_msg, 'name', 'Unknown')}' with {len(dbc_msg.signals)} signals")
+                log.debug("Found DBC message '%s' with %s signals", getattr(dbc_msg, 'name', 'Unknown'), len(dbc_msg.signals))
                 
-                for i, signal in enumerate(dbc_msg.signals):
-                    self.signals_table.insertRow(i)
-                    
-                    # Signal name
-                    self.signals_table.setItem(i, 0, QTableWidgetItem(signal.name))
-                    
-                    # Current value (from msg.dbc_signals or default)
-                    current_value = 0
-                    if msg.dbc_signals and signal.name in msg.dbc_signals:
-                        current_value = msg.dbc_signals[signal.name]
-                    
-                    # Create appropriate editor based on signal type
-                    if hasattr(signal, 'choices') and signal.choices:
-                        # Dropdown for enumerated values
-                        combo = QComboBox()
-                        
-                        # Set font and styling for better readability
-                        combo_font = QFont()
-                        combo_font.setPointSize(9)  # Match table font
-                        combo.setFont(combo_font)
-                        combo.setMaximumHeight(24)  # Constrain height to fit row
-                        combo.setStyleSheet("""
-                            QComboBox {
-                                padding: 2px 4px;
-                                border: 1px solid #ccc;
-                            }
-                            QComboBox::drop-down {
-                                width: 15px;
-                            }
-                            QComboBox QAbstractItemView {
-                                font-size: 9pt;
-                                selection-background-color: #3daee9;
-                            }
-                        """)
-                        
-                        for value, description in signal.choices.items():
-                            combo.addItem(f"{description} ({value})", value)
-                        # Set current value
-                        for j in range(combo.count()):
-                            if combo.itemData(j) == current_value:
-                                combo.setCurrentIndex(j)
-                                break
-                        combo.currentIndexChanged.connect(self.on_signal_value_changed)
-                        self.signals_table.setCellWidget(i, 1, combo)
-                    else:
-                        # Regular input for numeric values
-                        value_item = QTableWidgetItem(str(current_value))
-                        value_item.setFlags(value_item.flags() | Qt.ItemIsEditable)
-                        self.signals_table.setItem(i, 1, value_item)
-                    
-                    # Unit
-                    unit = getattr(signal, 'unit', '') or ''
-                    self.signals_table.setItem(i, 2, QTableWidgetItem(unit))
-                    
-                    # Description
-                    comment = getattr(signal, 'comment', '') or ''
-                    self.signals_table.setItem(i, 3, QTableWidgetItem(comment))
+                views = self.get_signal_views(msg_id_int, dbc_msg)
+                values = dict(msg.dbc_signals or {})
+                if len(views) >= self.SIGNAL_ROWS_ASYNC_THRESHOLD:
+                    # Large message: prepare row data on the thread pool, install widgets when ready
+                    QThreadPool.globalInstance().start(partial(
+                        self._build_signal_rows_task, self._signal_rows_generation, dbc_msg, views, values))
+                else:
+                    self._install_signal_rows(dbc_msg, self._build_signal_rows(views, values))
             else:
-                print(f"[DEBUG] No DBC message found for ID 0x{msg_id_int:X} or message has no signals")
+                log.debug("No DBC message found for ID 0x%X or message has no signals", msg_id_int)
                 if dbc_msg:
-                    print(f"[DEBUG] DBC message found but signals attribute: {hasattr(dbc_msg, 'signals')}")
+                    log.debug("DBC message found but signals attribute: %s", hasattr(dbc_msg, 'signals'))
                 
                 # Show user-friendly message when no signals are available
                 self.signals_table.insertRow(0)
@@ -1246,7 +1792,7 @@ class AdvancedLeftSidebar(QScrollArea):
                 self.signals_table.setSpan(0, 0, 1, 4)  # Span across all columns
                     
         except Exception as e:
-            print(f"[DEBUG] Error populating signals table: {e}")
+            log.debug("Error populating signals table: %s", e)
             # Show error message in table
             self.signals_table.insertRow(0)
             error_item = QTableWidgetItem(f"Error loading DBC signals: {str(e)}")
@@ -1256,15 +1802,103 @@ class AdvancedLeftSidebar(QScrollArea):
         
         finally:
             # Always re-enable updates to prevent the table from staying frozen
-            self.signals_table.setUpdatesEnabled(True)
-            # Force a single clean repaint to prevent artifacts
-            self.signals_table.repaint()
+            self.signals_table.blockSignals(was_blocked)
+            self.signals_table.setUpdatesEnabled(True)  # Schedules a deferred repaint
+    
+    @staticmethod
+    def _build_signal_rows(views, values):
+        """Build plain row specs (name, value, combo items, combo index, unit, comment); no Qt calls."""
+        rows = []
+        for signal in views:
+            current_value = values.get(signal.name, 0)
+            items = [(f"{description} ({value})", value) for value, description in signal.choices]
+            index = next((j for j, (_, value) in enumerate(items) if value == current_value), 0)
+            rows.append((signal.name, current_value, items, index, signal.unit, signal.comment))
+        return rows
+    
+    def _build_signal_rows_task(self, generation, dbc_msg, views, values):
+        """Thread pool task: build the row specs and hand them back to the GUI thread."""
+        self._signal_rows_ready.emit(generation, dbc_msg, self._build_signal_rows(views, values))
+    
+    def _on_signal_rows_ready(self, generation, dbc_msg, rows):
+        """Install rows built on the thread pool unless a newer population superseded them."""
+        if generation == self._signal_rows_generation:
+            self._install_signal_rows(dbc_msg, rows)
+    
+    def _install_signal_rows(self, dbc_msg, rows):
+        """Create the signals table cells and editors from prepared row specs."""
+        tbl = self.signals_table
+        set_item = tbl.setItem
+        tbl.setUpdatesEnabled(False)
+        was_blocked = tbl.blockSignals(True)
+        try:
+            # Size the table once, then fill cells by index
+            tbl.setRowCount(len(rows))
+            for i, (name, current_value, items, index, unit, comment) in enumerate(rows):
+                # Signal name
+                set_item(i, _SIG_COL_NAME, QTableWidgetItem(name))
+                
+                # Create appropriate editor based on signal type
+                if items:
+                    # Dropdown for enumerated values
+                    combo = QComboBox()
+                    
+                    # Set font and styling for better readability
+                    combo.setFont(self._signals_font)  # Match table font
+                    combo.setMaximumHeight(24)  # Constrain height to fit row
+                    
+                    for label, value in items:
+                        combo.addItem(label, value)
+                    combo.setCurrentIndex(index)
+                    combo.currentIndexChanged.connect(self.on_signal_value_changed)
+                    tbl.setCellWidget(i, _SIG_COL_VALUE, combo)
+                else:
+                    # Regular input for numeric values
+                    value_item = QTableWidgetItem(str(current_value))
+                    value_item.setFlags(value_item.flags() | Qt.ItemIsEditable)
+                    set_item(i, _SIG_COL_VALUE, value_item)
+                
+                # Unit
+                set_item(i, _SIG_COL_UNIT, QTableWidgetItem(unit))
+                
+                # Description
+                set_item(i, _SIG_COL_DESC, QTableWidgetItem(comment))
+            self._signals_table_msg = dbc_msg
+        finally:
+            tbl.blockSignals(was_blocked)
+            tbl.setUpdatesEnabled(True)
+    
+    def _refresh_signal_values(self, dbc_msg, msg):
+        """Update values in the existing signal rows without rebuilding widgets."""
+        values = msg.dbc_signals or {}
+        tbl = self.signals_table
+        with QSignalBlocker(tbl):
+            for i, signal in enumerate(dbc_msg.signals):
+                current_value = values.get(signal.name, 0)
+                widget = tbl.cellWidget(i, _SIG_COL_VALUE)
+                if isinstance(widget, QComboBox):
+                    with QSignalBlocker(widget):
+                        widget.setCurrentIndex(0)
+                        for j in range(widget.count()):
+                            if widget.itemData(j) == current_value:
+                                widget.setCurrentIndex(j)
+                                break
+                else:
+                    value_item = tbl.item(i, _SIG_COL_VALUE)
+                    if value_item:
+                        value_item.setText(str(current_value))
     
     def on_raw_data_changed(self):
         """Handle raw data text change."""
+        self._hex_refresh_timer.start()
+        if not self.apply_changes_btn.isEnabled():
+            self.apply_changes_btn.setEnabled(True)
+        if not self.revert_changes_btn.isEnabled():
+            self.revert_changes_btn.setEnabled(True)
+    
+    def _refresh_hex_viewer(self):
+        """Refresh the hex viewer from the current raw data text."""
         self.update_hex_viewer(self.raw_data_edit.text())
-        self.apply_changes_btn.setEnabled(True)
-        self.revert_changes_btn.setEnabled(True)
     
     def on_signal_value_changed(self):
         """Handle signal value change."""
@@ -1278,24 +1912,27 @@ class AdvancedLeftSidebar(QScrollArea):
                     msg.dbc_signals = {}
                 
                 # Update signal values from table
-                for i in range(self.signals_table.rowCount()):
-                    signal_name_item = self.signals_table.item(i, 0)
+                tbl = self.signals_table
+                item, cell_widget = tbl.item, tbl.cellWidget
+                dbc_signals = msg.dbc_signals
+                for i in range(tbl.rowCount()):
+                    signal_name_item = item(i, _SIG_COL_NAME)
                     if signal_name_item:
                         signal_name = signal_name_item.text()
                         
                         # Get value from widget
-                        value_widget = self.signals_table.cellWidget(i, 1)
+                        value_widget = cell_widget(i, _SIG_COL_VALUE)
                         if isinstance(value_widget, QComboBox):
                             # Dropdown - get selected value
-                            msg.dbc_signals[signal_name] = value_widget.currentData()
+                            dbc_signals[signal_name] = value_widget.currentData()
                         else:
                             # Text input - get text value
-                            value_item = self.signals_table.item(i, 1)
+                            value_item = item(i, _SIG_COL_VALUE)
                             if value_item:
                                 try:
-                                    msg.dbc_signals[signal_name] = float(value_item.text())
+                                    dbc_signals[signal_name] = float(value_item.text())
                                 except ValueError:
-                                    msg.dbc_signals[signal_name] = 0
+                                    dbc_signals[signal_name] = 0
                 
                 # Try to update raw data from signals if DBC manager supports it
                 self.update_raw_data_from_signals(msg)
@@ -1304,7 +1941,7 @@ class AdvancedLeftSidebar(QScrollArea):
             self.revert_changes_btn.setEnabled(True)
             
         except Exception as e:
-            print(f"[DEBUG] Error in signal value change: {e}")
+            log.debug("Error in signal value change: %s", e)
     
     def update_raw_data_from_signals(self, msg):
         """Update raw data from signal values using DBC encoding."""
@@ -1313,14 +1950,21 @@ class AdvancedLeftSidebar(QScrollArea):
                 return
             
             # Get DBC message definition
-            msg_id_int = None
-            if isinstance(msg.msg_id, str):
-                if msg.msg_id.startswith(('0x', '0X')):
-                    msg_id_int = int(msg.msg_id, 16)
-                else:
-                    msg_id_int = int(msg.msg_id, 16)
-            else:
-                msg_id_int = int(msg.msg_id)
+            msg_id_int = self._parse_msg_id(msg.msg_id)
+            if msg_id_int is None:
+                log.debug("Invalid message ID for signal encoding: %s", msg.msg_id)
+                return
+            
+            # Skip re-encoding when the ID, DBC and signal values are the same as last time and the
+            # payload is still what that encode produced (revert or raw edits change it)
+            row = getattr(self, 'current_editing_row', None)
+            try:
+                sig_key = (msg_id_int, id(getattr(self.dbc_manager, 'active_database', None)),
+                           tuple(sorted(msg.dbc_signals.items())))
+            except TypeError:
+                sig_key = None  # Unorderable signal names: always encode
+            if sig_key is not None and self._last_encoded_signals.get(row) == (sig_key, msg.data):
+                return
             
             # Try to encode the message using DBC manager
             if hasattr(self.dbc_manager, 'encode_message'):
@@ -1328,19 +1972,18 @@ class AdvancedLeftSidebar(QScrollArea):
                     # Use DBC manager to encode signal values to raw data
                     encoded_data = self.dbc_manager.encode_message(msg_id_int, msg.dbc_signals)
                     if encoded_data:
-                        # Update raw data display
-                        hex_string = ' '.join(f'{b:02X}' for b in encoded_data)
+                        # Update message data, then the raw data display from its text
+                        msg.set_data_bytes(encoded_data)
+                        msg.dlc = len(encoded_data)
+                        hex_string = msg.data
                         self.raw_data_edit.setText(hex_string)
                         self.update_hex_viewer(hex_string)
                         
-                        # Update message data
-                        msg.data = hex_string
-                        msg.dlc = len(encoded_data)
-                        
-                        print(f"[DEBUG] Updated raw data from signals: {hex_string}")
+                        log.debug("Updated raw data from signals: %s", hex_string)
+                        self._last_encoded_signals[row] = (sig_key, msg.data)
                         return
                 except Exception as e:
-                    print(f"[DEBUG] Error encoding message: {e}")
+                    log.debug("Error encoding message: %s", e)
             
             # Fallback: try direct DBC database encoding
             if hasattr(self.dbc_manager, 'active_database') and self.dbc_manager.active_database:
@@ -1349,44 +1992,81 @@ class AdvancedLeftSidebar(QScrollArea):
                     if hasattr(db, 'encode_message'):
                         encoded_data = db.encode_message(msg_id_int, msg.dbc_signals)
                         if encoded_data:
-                            hex_string = ' '.join(f'{b:02X}' for b in encoded_data)
+                            msg.set_data_bytes(encoded_data)
+                            msg.dlc = len(encoded_data)
+                            hex_string = msg.data
                             self.raw_data_edit.setText(hex_string)
                             self.update_hex_viewer(hex_string)
-                            msg.data = hex_string
-                            msg.dlc = len(encoded_data)
-                            print(f"[DEBUG] Updated raw data from signals (fallback): {hex_string}")
+                            log.debug("Updated raw data from signals (fallback): %s", hex_string)
+                            self._last_encoded_signals[row] = (sig_key, msg.data)
                             return
                 except Exception as e:
-                    print(f"[DEBUG] Error with fallback encoding: {e}")
+                    log.debug("Error with fallback encoding: %s", e)
             
-            print(f"[DEBUG] Could not encode signals to raw data - DBC encoding not available")
+            log.debug("Could not encode signals to raw data - DBC encoding not available")
             
         except Exception as e:
-            print(f"[DEBUG] Error updating raw data from signals: {e}")
+            log.debug("Error updating raw data from signals: %s", e)
     
     def update_hex_viewer(self, data_text):
         """Update the hex viewer with formatted data."""
+        # A direct update supersedes any pending debounced refresh
+        self._hex_refresh_timer.stop()
         try:
-            # Parse hex data
-            hex_bytes = []
-            if data_text.strip():
-                # Remove spaces and parse hex
-                clean_data = data_text.replace(' ', '').replace('0x', '')
-                for i in range(0, len(clean_data), 2):
-                    if i + 1 < len(clean_data):
-                        hex_bytes.append(int(clean_data[i:i+2], 16))
+            # Remove spaces and parse hex (a trailing odd nibble is ignored)
+            clean_data = data_text.replace(' ', '').replace('0x', '')
+            if len(clean_data) % 2:
+                clean_data = clean_data[:-1]
+            hex_bytes = bytes.fromhex(clean_data)
+            
+            # Same length with a few changed bytes: patch those in place
+            last = self._last_hex_bytes
+            if hex_bytes and last is not None and len(last) == len(hex_bytes):
+                changed = [i for i, (a, b) in enumerate(zip(last, hex_bytes)) if a != b]
+                if len(changed) <= 4:
+                    if changed:
+                        self._patch_hex_viewer(last, hex_bytes, changed)
+                    self._last_hex_bytes = hex_bytes
+                    return
             
             # Format as hex dump
             if hex_bytes:
-                hex_line = ' '.join(f'{b:02X}' for b in hex_bytes)
-                ascii_line = ''.join(chr(b) if 32 <= b <= 126 else '.' for b in hex_bytes)
-                formatted = f"Hex: {hex_line}\nASC: {ascii_line}\nDec: {' '.join(str(b) for b in hex_bytes)}"
+                hex_line = hex_bytes.hex(' ').upper()
+                ascii_line = hex_bytes.translate(_PRINTABLE_TABLE).decode('ascii')
+                formatted = f"Hex: {hex_line}\nASC: {ascii_line}\nDec: {' '.join(map(str, hex_bytes))}"
             else:
                 formatted = "No data"
             
             self.hex_viewer.setPlainText(formatted)
+            self._last_hex_bytes = hex_bytes or None
         except Exception as e:
             self.hex_viewer.setPlainText(f"Invalid hex data: {e}")
+            self._last_hex_bytes = None
+    
+    def _patch_hex_viewer(self, old, new, changed):
+        """Rewrite only the changed bytes of the hex dump shown for old (same length as new)."""
+        n = len(new)
+        asc_start = 3 * n + 10  # After "Hex: " + n bytes with separators + newline + "ASC: "
+        dec_start = 4 * n + 16  # After the ASC line + newline + "Dec: "
+        dec_offsets = []
+        pos = dec_start
+        for b in old:
+            dec_offsets.append(pos)
+            pos += len(str(b)) + 1
+        
+        # Edit back to front so earlier positions stay valid as the Dec line changes width
+        edits = [(dec_offsets[i], dec_offsets[i] + len(str(old[i])), str(new[i])) for i in changed]
+        edits += [(asc_start + i, asc_start + i + 1, chr(new[i]) if 32 <= new[i] <= 126 else '.') for i in changed]
+        edits += [(5 + 3 * i, 7 + 3 * i, f"{new[i]:02X}") for i in changed]
+        edits.sort(reverse=True)
+        
+        cursor = QTextCursor(self.hex_viewer.document())
+        cursor.beginEditBlock()
+        for start, end, text in edits:
+            cursor.setPosition(start)
+            cursor.setPosition(end, QTextCursor.KeepAnchor)
+            cursor.insertText(text)
+        cursor.endEditBlock()
     
     def apply_editor_changes(self):
         """Apply changes from the editor to the message."""
@@ -1398,7 +2078,7 @@ class AdvancedLeftSidebar(QScrollArea):
             return
         
         msg = self.tx_messages[row]
-        print(f"[DEBUG] Applying editor changes for message {msg.msg_id}")
+        log.debug("Applying editor changes for message %s", msg.msg_id)
         
         # Update raw data
         msg.data = self.raw_data_edit.text()
@@ -1414,95 +2094,98 @@ class AdvancedLeftSidebar(QScrollArea):
         if not msg.dbc_signals:
             msg.dbc_signals = {}
             
-        for i in range(self.signals_table.rowCount()):
-            signal_name_item = self.signals_table.item(i, 0)
+        tbl = self.signals_table
+        item, cell_widget = tbl.item, tbl.cellWidget
+        for i in range(tbl.rowCount()):
+            signal_name_item = item(i, _SIG_COL_NAME)
             if signal_name_item:
                 signal_name = signal_name_item.text()
                 
                 # Get value from widget
-                value_widget = self.signals_table.cellWidget(i, 1)
+                value_widget = cell_widget(i, _SIG_COL_VALUE)
                 if isinstance(value_widget, QComboBox):
                     msg.dbc_signals[signal_name] = value_widget.currentData()
-                    print(f"[DEBUG] Updated signal {signal_name} = {value_widget.currentData()} (dropdown)")
+                    log.debug("Updated signal %s = %s (dropdown)", signal_name, value_widget.currentData())
                 else:
-                    value_item = self.signals_table.item(i, 1)
+                    value_item = item(i, _SIG_COL_VALUE)
                     if value_item:
                         try:
                             msg.dbc_signals[signal_name] = float(value_item.text())
-                            print(f"[DEBUG] Updated signal {signal_name} = {value_item.text()} (text)")
+                            log.debug("Updated signal %s = %s (text)", signal_name, value_item.text())
                         except ValueError:
-                            print(f"[DEBUG] Invalid value for signal {signal_name}: {value_item.text()}")
+                            log.debug("Invalid value for signal %s: %s", signal_name, value_item.text())
         
-        # Temporarily disconnect selection changes to prevent editor reload
-        self.tx_table.selectionModel().selectionChanged.disconnect()
-        
-        # Refresh only the specific row in the table to avoid full reload
-        self.update_tx_table_row(row, msg)
-        
-        # Reconnect selection changes
-        self.tx_table.selectionModel().selectionChanged.connect(self.on_tx_selection_changed)
+        # Refresh only the specific row in the table, batched with any other pending rows
+        self.queue_tx_row_update(row)
         
         # Reset button states
         self.apply_changes_btn.setEnabled(False)
         self.revert_changes_btn.setEnabled(False)
         
-        print(f"[DEBUG] Changes applied successfully, editor remains active")
+        log.debug("Changes applied successfully, editor remains active")
+    
+    def queue_tx_row_update(self, row):
+        """Schedule a TX table row redraw; rows queued in the same event-loop turn are drawn together."""
+        self._sync_tx_ids(row)
+        self._pending_row_updates.add(row)
+        if not self._row_flush_scheduled:
+            self._row_flush_scheduled = True
+            QTimer.singleShot(0, self._flush_row_updates)
+    
+    def _flush_row_updates(self):
+        """Redraw all queued TX table rows under a single updates-disabled guard."""
+        self._row_flush_scheduled = False
+        rows, self._pending_row_updates = self._pending_row_updates, set()
+        rows = [row for row in rows if row < len(self.tx_messages)]
+        if not rows:
+            return
+        # Block selection changes to prevent editor reload
+        with self._tx_table_bulk_update(), QSignalBlocker(self.tx_table.selectionModel()):
+            for row in sorted(rows):
+                self.update_tx_table_row(row, self.tx_messages[row])
     
-    def update_tx_table_row(self, row, msg):
+    @contextmanager
+    def _tx_table_bulk_update(self):
+        """Suspend painting and sorting of the TX table while it is changed in bulk."""
+        table = self.tx_table
+        sorting = table.isSortingEnabled()
+        table.setSortingEnabled(False)
+        table.setUpdatesEnabled(False)
+        try:
+            yield
+        finally:
+            table.setUpdatesEnabled(True)
+            table.setSortingEnabled(sorting)
+            table.viewport().update()
+    
+    def update_tx_table_row(self, row, msg, changed=None):
         """Update a specific row in the TX table without full refresh."""
         try:
-            # Column mapping: ["Send", "ID", "DBC Name", "DLC", "Data", "Period (ms)", "Count", "Sent", "Control", "Signals"]
-            # Update the table items for this specific row with correct column indices
-            
-            # Column 1: ID
-            self.tx_table.setItem(row, 1, QTableWidgetItem(str(msg.msg_id)))
-            
-            # Column 2: DBC Name
-            self.tx_table.setItem(row, 2, QTableWidgetItem(msg.dbc_name if msg.dbc_name else "N/A"))
+            self._sync_tx_ids(row)
             
-            # Column 3: DLC
-            self.tx_table.setItem(row, 3, QTableWidgetItem(str(msg.dlc)))
-            
-            # Column 4: Data
-            self.tx_table.setItem(row, 4, QTableWidgetItem(msg.data))
-            
-            # Column 5: Period (ms)
-            self.tx_table.setItem(row, 5, QTableWidgetItem(str(msg.cycle_ms)))
-            
-            # Column 6: Count (total_sent)
-            self.tx_table.setItem(row, 6, QTableWidgetItem(str(msg.total_sent)))
-            
-            # Column 7: Sent (same as total_sent for now)
-            self.tx_table.setItem(row, 7, QTableWidgetItem(str(msg.total_sent)))
-            
-            # Column 8: Control bits
-            control_bits = []
-            if msg.rtr:
-                control_bits.append("RTR")
-            if msg.extended_id:
-                control_bits.append("EXT")
-            if msg.fd:
-                control_bits.append("FD")
-            if msg.brs:
-                control_bits.append("BRS")
-            if msg.esi:
-                control_bits.append("ESI")
-            control_text = ", ".join(control_bits) if control_bits else "STD"
-            self.tx_table.setItem(row, 8, QTableWidgetItem(control_text))
-            
-            # Column 9: Signals count
-            signal_count = len(msg.dbc_signals) if msg.dbc_signals else 0
-            self.tx_table.setItem(row, 9, QTableWidgetItem(str(signal_count)))
+            # The model reads the row straight from tx_messages; just repaint its cells
+            if changed is None:
+                self.tx_model.refresh_row(row, TxMessagesModel.COL_ID)
+            else:
+                self.tx_model.refresh_fields(row, changed)
             
-            print(f"[DEBUG] Updated TX table row {row} for message {msg.msg_id} with correct column mapping")
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("Updated TX table row %s for message %s", row, msg.msg_id)
             
         except Exception as e:
-            print(f"[DEBUG] Error updating TX table row {row}: {e}")
+            log.debug("Error updating TX table row %s: %s", row, e)
     
     def revert_editor_changes(self):
         """Revert editor changes to original message data."""
         if hasattr(self, 'original_message_data') and hasattr(self, 'current_editing_row'):
-            self.load_message_in_editor(self.original_message_data, self.current_editing_row)
+            row = self.current_editing_row
+            if row is None or row >= len(self.tx_messages):
+                return
+            msg = self.tx_messages[row]
+            msg.msg_id, msg.dlc, msg.data, dbc_signals, msg.dbc_name = self.original_message_data
+            msg.dbc_signals = dict(dbc_signals)
+            self.queue_tx_row_update(row)
+            self.load_message_in_editor(msg, row)
 
     def _init_tx_model(self):
         """Initialize the data model for the transmit tab."""
@@ -1511,72 +2194,56 @@ class AdvancedLeftSidebar(QScrollArea):
             TxMessage('0x100', 8, '11 22 33 44 55 66 77 88', 100, 0, False),
             TxMessage('0x2A0', 4, 'DE AD BE EF', 500, 10, False)
         ]
-        self.tx_periodic_timers = {}  # key: row_index, value: QTimer
+        # Periodic sends share one timer driven by a heap of (due ms, token, message);
+        # entries are keyed by message identity so row changes need no bookkeeping
+        self._tx_schedule = []
+        self._tx_scheduled = {}  # id(message): token of its live heap entry
+        self._tx_schedule_seq = itertools.count()
+        self._tx_scheduler_timer = QTimer(self)
+        self._tx_scheduler_timer.setSingleShot(True)
+        self._tx_scheduler_timer.setTimerType(Qt.PreciseTimer)
+        self._tx_scheduler_timer.timeout.connect(self._on_tx_scheduler_tick)
+        self._sync_tx_ids()
+
+    def _sync_tx_ids(self, row=None):
+        """Refresh the parsed integer ID mirror of tx_messages (one row, or all rows)"""
+        if row is None:
+            self._tx_ids_int = [self._parse_msg_id(m.msg_id) for m in self.tx_messages]
+            self._tx_row_of = {id(m): i for i, m in enumerate(self.tx_messages)}
+        else:
+            msg = self.tx_messages[row]
+            self._tx_ids_int[row] = self._parse_msg_id(msg.msg_id)
+            self._tx_row_of[id(msg)] = row
+
+    def tx_message_id(self, row):
+        """Return the parsed integer ID of the TX message at row, or None"""
+        return self._tx_ids_int[row]
 
     def populate_tx_table(self):
         """Populate the transmit table with messages from the model."""
-        self.tx_table.blockSignals(True)
-        self.tx_table.setRowCount(0)
-        
-        for i, msg in enumerate(self.tx_messages):
-            self.tx_table.insertRow(i)
-            
-            # Checkbox for active state
-            send_checkbox = QCheckBox()
-            send_checkbox.setChecked(msg.is_active)
-            # Store row index as property to avoid lambda closure issues
-            send_checkbox.row_index = i
-            send_checkbox.toggled.connect(lambda checked, checkbox=send_checkbox: 
-                                        self.update_message_active_state(checkbox.row_index, checked))
-            self.tx_table.setCellWidget(i, 0, send_checkbox)
-            
-            # Message ID
-            self.tx_table.setItem(i, 1, QTableWidgetItem(str(msg.msg_id)))
-            
-            # DBC Name
-            dbc_name = msg.dbc_name if msg.dbc_name else "N/A"
-            self.tx_table.setItem(i, 2, QTableWidgetItem(dbc_name))
-            
-            # DLC
-            self.tx_table.setItem(i, 3, QTableWidgetItem(str(msg.dlc)))
-            
-            # Data
-            self.tx_table.setItem(i, 4, QTableWidgetItem(msg.data))
-            
-            # Cycle time
-            cycle_text = str(msg.cycle_ms) if msg.cycle_ms > 0 else 'Manual'
-            self.tx_table.setItem(i, 5, QTableWidgetItem(cycle_text))
-            
-            # Count
-            count_text = str(msg.count) if msg.count > 0 else '∞'
-            self.tx_table.setItem(i, 6, QTableWidgetItem(count_text))
-            
-            # Sent counter
-            self.tx_table.setItem(i, 7, QTableWidgetItem(str(msg.total_sent)))
-            
-            # Control bits
-            control_bits = []
-            if msg.rtr: control_bits.append("RTR")
-            if msg.extended_id: control_bits.append("EXT")
-            if msg.fd: control_bits.append("FD")
-            if msg.brs: control_bits.append("BRS")
-            if msg.esi: control_bits.append("ESI")
-            control_text = ", ".join(control_bits) if control_bits else "STD"
-            self.tx_table.setItem(i, 8, QTableWidgetItem(control_text))
-            
-            # Signals count
-            signals_count = len(msg.dbc_signals) if msg.dbc_signals else 0
-            signals_text = f"{signals_count} signals" if signals_count > 0 else "No signals"
-            self.tx_table.setItem(i, 9, QTableWidgetItem(signals_text))
-            
-            # Color code active rows
-            if msg.is_active:
-                for col in range(self.tx_table.columnCount()):
-                    item = self.tx_table.item(i, col)
-                    if item:
-                        item.setBackground(QColor("lightgreen"))
-                        
-        self.tx_table.blockSignals(False)
+        self._sync_tx_ids()
+        self._pending_row_updates.clear()  # Full rebuild supersedes queued row redraws
+        self._last_encoded_signals.clear()  # Row indices may have shifted
+        # Rows were added or removed: let the view re-query the model
+        with self._tx_table_bulk_update():
+            self.tx_model.reset()
+        if not self.tx_table.selectionModel().hasSelection():
+            # A reset clears the selection without emitting selectionChanged
+            self.on_tx_selection_changed()
+        
+        self._schedule_status_update()
+
+    def _schedule_status_update(self):
+        """Refresh the TX status labels and buttons once per event-loop turn, however often asked."""
+        if not self._status_dirty:
+            self._status_dirty = True
+            QTimer.singleShot(0, self._flush_status)
+    
+    def _flush_status(self):
+        """Apply a scheduled status label and button refresh."""
+        if not self._status_dirty:
+            return
+        self._status_dirty = False
         self.update_status_labels()
         self.update_button_states()
 
@@ -1585,7 +2252,7 @@ class AdvancedLeftSidebar(QScrollArea):
         active_count = sum(1 for msg in self.tx_messages if msg.is_active)
         self.active_count_label.setText(f"Active: {active_count}")
         
-        if any(timer.isActive() for timer in self.tx_periodic_timers.values()):
+        if self._tx_scheduled:
             self.tx_status_label.setText("🟢 Transmitting...")
             self.tx_status_label.setStyleSheet("color: #2e7d32; font-weight: bold;")
         else:
@@ -1594,9 +2261,15 @@ class AdvancedLeftSidebar(QScrollArea):
 
     def update_button_states(self):
         """Update button enabled states based on selection and content"""
-        has_selection = bool(self.tx_table.selectionModel().selectedRows())
+        has_selection = self.tx_table.selectionModel().hasSelection()
         has_messages = len(self.tx_messages) > 0
         
+        # Selection drags fire this per row; leave the widgets alone unless something changed
+        new_state = (has_selection, has_messages)
+        if new_state == self._last_btn_state:
+            return
+        self._last_btn_state = new_state
+        
         self.edit_action.setEnabled(has_selection)
         self.delete_action.setEnabled(has_selection)
         self.send_once_btn.setEnabled(has_selection)
@@ -1605,7 +2278,7 @@ class AdvancedLeftSidebar(QScrollArea):
 
     def add_tx_message(self):
         """Add a new message via dialog"""
-        print("[DEBUG] Opening add message dialog")
+        log.debug("Opening add message dialog")
         
         dialog = self.TxMessageDialog(self)
         dialog_result = dialog.exec()
@@ -1624,21 +2297,17 @@ class AdvancedLeftSidebar(QScrollArea):
             new_row = len(self.tx_messages) - 1
             self.tx_table.selectRow(new_row)
             
-            print(f"[DEBUG] New message {new_msg.msg_id} added successfully")
+            log.debug("New message %s added successfully", new_msg.msg_id)
         else:
-            print("[DEBUG] Add message dialog cancelled")
+            log.debug("Add message dialog cancelled")
         
         # Ensure buttons are properly updated
-        self.update_button_states()
+        self._schedule_status_update()
 
     def edit_tx_message(self):
         """Edit the selected transmit message in a dialog."""
-        selected_rows = self.tx_table.selectionModel().selectedRows()
-        if not selected_rows:
-            return
-
-        row = selected_rows[0].row()
-        if row >= len(self.tx_messages):
+        row = self._selected_row_cache
+        if row is None or row >= len(self.tx_messages):
             return
             
         # IMPORTANT: Apply any pending editor changes before opening dialog
@@ -1646,11 +2315,11 @@ class AdvancedLeftSidebar(QScrollArea):
         if (hasattr(self, 'current_editing_row') and 
             self.current_editing_row == row and 
             hasattr(self, 'raw_data_edit')):
-            print("[DEBUG] Auto-applying editor changes before opening edit dialog")
+            log.debug("Auto-applying editor changes before opening edit dialog")
             self.apply_editor_changes()
             
         msg = self.tx_messages[row]
-        print(f"[DEBUG] Opening edit dialog for message {msg.msg_id} at row {row}")
+        log.debug("Opening edit dialog for message %s at row %s", msg.msg_id, row)
         
         # Store current selection to restore later
         current_selection = row
@@ -1664,93 +2333,78 @@ class AdvancedLeftSidebar(QScrollArea):
         if dialog_result == QDialog.Accepted:
             # Update the message in the list
             updated_msg = dialog.get_message()
+            changed = msg.diff(updated_msg)
             self.tx_messages[row] = updated_msg
             
+            # Periodic sending follows the edited message object
+            self._unschedule_tx(msg)
+            if self.start_stop_action.isChecked() and updated_msg.is_active and updated_msg.cycle_ms > 0:
+                self._schedule_tx(updated_msg)
+            
             # Use selective update instead of full table rebuild
-            self.update_tx_table_row(row, updated_msg)
+            self.update_tx_table_row(row, updated_msg, changed)
             
             # IMPORTANT: Sync the editor with dialog changes if it's showing the same message
             if (hasattr(self, 'current_editing_row') and 
                 self.current_editing_row == row):
-                print("[DEBUG] Syncing editor with dialog changes")
+                log.debug("Syncing editor with dialog changes")
                 self.load_message_in_editor(updated_msg, row)
             
             # Restore selection to maintain button states
             self.tx_table.selectRow(current_selection)
             
-            print(f"[DEBUG] Message {updated_msg.msg_id} updated successfully")
+            log.debug("Message %s updated successfully", updated_msg.msg_id)
         else:
-            print(f"[DEBUG] Edit dialog cancelled for message {msg.msg_id}")
+            log.debug("Edit dialog cancelled for message %s", msg.msg_id)
         
         # Ensure buttons remain enabled after dialog
-        self.update_button_states()
-    
-    def update_button_states(self):
-        """Update the state of edit/delete buttons based on selection."""
-        try:
-            has_selection = bool(self.tx_table.selectionModel().selectedRows())
-            
-            # Enable/disable buttons based on selection
-            self.edit_action.setEnabled(has_selection)
-            self.delete_action.setEnabled(has_selection)
-            
-            # Also update send buttons
-            self.send_once_btn.setEnabled(has_selection)
-            
-            print(f"[DEBUG] Button states updated: selection={has_selection}")
-            
-        except Exception as e:
-            print(f"[DEBUG] Error updating button states: {e}")
+        self._schedule_status_update()
     
     def delete_tx_message(self):
         """Delete the selected message from the transmit table."""
-        selected_rows = self.tx_table.selectionModel().selectedRows()
-        if not selected_rows:
+        # Walk the selection ranges instead of materializing an index per selected cell
+        rows_to_delete = set()
+        for selection_range in self.tx_table.selectionModel().selection():
+            rows_to_delete.update(range(selection_range.top(), selection_range.bottom() + 1))
+        if not rows_to_delete:
             return
 
-        # Stop any active timer for deleted rows
-        rows_to_delete = [index.row() for index in selected_rows]
+        # Stop periodic sending of deleted rows
         for row in rows_to_delete:
-            if row in self.tx_periodic_timers:
-                self.tx_periodic_timers[row].stop()
-                del self.tx_periodic_timers[row]
+            if row < len(self.tx_messages):
+                self._unschedule_tx(self.tx_messages[row])
 
         # Sort rows in descending order to avoid index shifting issues
-        for row in sorted(rows_to_delete, reverse=True):
-            if row < len(self.tx_messages):
-                del self.tx_messages[row]
-        
-        # Update timer dictionary keys after deletion
-        new_timers = {}
-        for old_row, timer in self.tx_periodic_timers.items():
-            new_row = old_row
-            for deleted_row in sorted(rows_to_delete):
-                if old_row > deleted_row:
-                    new_row -= 1
-            if new_row >= 0:
-                new_timers[new_row] = timer
-        self.tx_periodic_timers = new_timers
+        deleted_sorted = sorted(rows_to_delete)
+        with self._tx_table_bulk_update():
+            for row in reversed(deleted_sorted):
+                if row < len(self.tx_messages):
+                    del self.tx_messages[row]
+
+        # Timers are keyed by message, so only the editor's row index needs shifting
+        editing_row = getattr(self, 'current_editing_row', None)
+        if editing_row is not None:
+            shift = bisect.bisect_left(deleted_sorted, editing_row)
+            if shift < len(deleted_sorted) and deleted_sorted[shift] == editing_row:
+                del self.current_editing_row
+            else:
+                self.current_editing_row = editing_row - shift
         
         self.populate_tx_table()
 
     def clear_tx_messages(self):
         """Clear all messages from the transmit table."""
-        # Stop all timers
-        for timer in self.tx_periodic_timers.values():
-            timer.stop()
-        self.tx_periodic_timers.clear()
+        # Stop periodic sending
+        self._clear_tx_schedule()
         
-        self.tx_messages.clear()
-        self.populate_tx_table()
+        with self._tx_table_bulk_update():
+            self.tx_messages.clear()
+            self.populate_tx_table()
 
     def send_selected_once(self):
         """Send selected message once"""
-        selected_rows = self.tx_table.selectionModel().selectedRows()
-        if not selected_rows:
-            return
-            
-        row = selected_rows[0].row()
-        if row < len(self.tx_messages):
+        row = self._selected_row_cache
+        if row is not None and row < len(self.tx_messages):
             self.send_single_message(row)
 
     def send_all_once(self):
@@ -1758,69 +2412,37 @@ class AdvancedLeftSidebar(QScrollArea):
         for i in range(len(self.tx_messages)):
             self.send_single_message(i)
 
-    def send_single_message(self, row):
-        """Send a single message and update counters"""
+    def send_single_message(self, row, batch=None):
+        """Send a single message (or append it to batch) and update counters"""
         if row >= len(self.tx_messages):
             return
 
         msg = self.tx_messages[row]
         
         try:
-            # Parse message ID
-            if isinstance(msg.msg_id, str):
-                if msg.msg_id.startswith('0x') or msg.msg_id.startswith('0X'):
-                    msg_id = int(msg.msg_id, 16)
-                else:
-                    msg_id = int(msg.msg_id, 16)  # Assume hex even without 0x prefix
+            # Message ID comes pre-parsed from the ID mirror
+            msg_id = self.tx_message_id(row)
+            if msg_id is None:
+                raise ValueError(f"invalid message ID {msg.msg_id!r}")
+
+            # Message dictionary for backend, rebuilt only when ID, payload or flags change.
+            # Its payload is an immutable tuple of ints, which the backend and the TX log both accept
+            message_data = msg.message_data(msg_id)
+            
+            # Emit signal to send message, or leave it to the caller's batch
+            if batch is None:
+                self.send_message.emit(message_data)
             else:
-                msg_id = int(msg.msg_id)
-
-            # Parse data bytes
-            data_bytes = []
-            if msg.data.strip():
-                for byte_str in msg.data.split():
-                    if byte_str.strip():
-                        # Handle both hex (with/without 0x) and decimal
-                        if byte_str.startswith('0x') or byte_str.startswith('0X'):
-                            data_bytes.append(int(byte_str, 16))
-                        else:
-                            try:
-                                # Try hex first
-                                data_bytes.append(int(byte_str, 16))
-                            except ValueError:
-                                # Fall back to decimal
-                                data_bytes.append(int(byte_str))
-
-            # Ensure DLC matches data length or pad/truncate as needed
-            if len(data_bytes) < msg.dlc:
-                data_bytes.extend([0] * (msg.dlc - len(data_bytes)))  # Pad with zeros
-            elif len(data_bytes) > msg.dlc:
-                data_bytes = data_bytes[:msg.dlc]  # Truncate
-
-            # Create message dictionary for backend
-            message_data = {
-                'id': msg_id,
-                'dlc': msg.dlc,
-                'data': data_bytes,
-                'extended': msg_id > 0x7FF,  # Auto-detect extended ID
-                'fd': msg.fd,  # Include CAN FD flag
-                'brs': msg.brs,  # Include Bit Rate Switch flag
-                'esi': msg.esi,  # Include Error State Indicator flag
-            }
-            
-            # Emit signal to send message
-            self.send_message.emit(message_data)
+                batch.append(message_data)
             
             # Update sent counter
             msg.total_sent += 1
             
             # Update the table display
-            if row < self.tx_table.rowCount():
-                sent_item = self.tx_table.item(row, 6)
-                if sent_item:
-                    sent_item.setText(str(msg.total_sent))
+            self.tx_model.refresh_row(row, TxMessagesModel.COL_SENT, TxMessagesModel.COL_SENT)
                     
-            print(f"[DEBUG] Sent message: ID=0x{msg_id:X}, DLC={msg.dlc}, Data={data_bytes}")
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("Sent message: ID=0x%X, DLC=%s, Data=%s", msg_id, msg.dlc, message_data['data'])
             
         except Exception as e:
             print(f"[ERROR] Failed to send message at row {row}: {e}")
@@ -1832,27 +2454,75 @@ class AdvancedLeftSidebar(QScrollArea):
             self.start_stop_action.setText("⏹️")
             self.start_stop_action.setToolTip("Stop all periodic messages")
             
-            # Start timers for all active messages with cycle > 0
-            for i, msg in enumerate(self.tx_messages):
+            # Schedule all active messages with cycle > 0
+            for msg in self.tx_messages:
                 if msg.is_active and msg.cycle_ms > 0:
-                    if i not in self.tx_periodic_timers:
-                        timer = QTimer(self)
-                        timer.timeout.connect(lambda row=i: self.send_periodic_message(row))
-                        timer.start(msg.cycle_ms)
-                        self.tx_periodic_timers[i] = timer
+                    self._schedule_tx(msg)
                         
         else:
             self.start_stop_action.setText("▶️")
             self.start_stop_action.setToolTip("Start all periodic messages")
             
-            # Stop all timers
-            for timer in self.tx_periodic_timers.values():
-                timer.stop()
-            self.tx_periodic_timers.clear()
+            # Stop the scheduler
+            self._clear_tx_schedule()
             
-        self.update_status_labels()
+        self._schedule_status_update()
 
-    def send_periodic_message(self, row):
+    def _schedule_tx(self, msg):
+        """Add a message to the periodic send schedule, first send one cycle from now."""
+        if id(msg) in self._tx_scheduled:
+            return
+        token = next(self._tx_schedule_seq)
+        self._tx_scheduled[id(msg)] = token
+        heapq.heappush(self._tx_schedule, (time.monotonic() * 1000 + msg.cycle_ms, token, msg))
+        self._arm_tx_scheduler()
+
+    def _unschedule_tx(self, msg):
+        """Remove a message from the periodic send schedule; its heap entry is dropped lazily."""
+        self._tx_scheduled.pop(id(msg), None)
+        if not self._tx_scheduled:
+            self._clear_tx_schedule()
+
+    def _clear_tx_schedule(self):
+        """Drop every scheduled message and stop the scheduler timer."""
+        self._tx_schedule.clear()
+        self._tx_scheduled.clear()
+        self._tx_scheduler_timer.stop()
+
+    def _arm_tx_scheduler(self):
+        """Restart the scheduler timer to fire when the earliest message is due."""
+        if not self._tx_schedule:
+            self._tx_scheduler_timer.stop()
+            return
+        delay = self._tx_schedule[0][0] - time.monotonic() * 1000
+        self._tx_scheduler_timer.start(max(0, math.ceil(delay)))
+
+    def _on_tx_scheduler_tick(self):
+        """Send every message that is due, then re-arm for the next one."""
+        now = time.monotonic() * 1000
+        schedule = self._tx_schedule
+        # Hand everything due in this tick to the backend at once when someone listens for batches
+        batch = [] if self.receivers(SIGNAL('send_messages_batch(QVariantList)')) else None
+        while schedule and schedule[0][0] <= now:
+            due, token, msg = heapq.heappop(schedule)
+            if self._tx_scheduled.get(id(msg)) != token:
+                continue  # Unscheduled since it was queued
+            row = self._tx_row_of.get(id(msg))
+            if row is None or row >= len(self.tx_messages) or self.tx_messages[row] is not msg:
+                self._tx_scheduled.pop(id(msg), None)
+                continue
+            self.send_periodic_message(row, batch)
+            if self._tx_scheduled.get(id(msg)) == token:
+                # Keep the cadence; if we fell a whole cycle behind, restart it from now
+                due += msg.cycle_ms
+                if due <= now:
+                    due = now + msg.cycle_ms
+                heapq.heappush(schedule, (due, token, msg))
+        if batch:
+            self.send_messages_batch.emit(batch)
+        self._arm_tx_scheduler()
+
+    def send_periodic_message(self, row, batch=None):
         """Send a single message periodically and handle the count."""
         if row >= len(self.tx_messages):
             return
@@ -1860,54 +2530,42 @@ class AdvancedLeftSidebar(QScrollArea):
         msg = self.tx_messages[row]
         
         # Send the message
-        self.send_single_message(row)
+        self.send_single_message(row, batch)
         
         # Handle count-limited messages
         if msg.count > 0:
             msg.count -= 1
             if msg.count == 0:
-                # Stop timer and deactivate message
-                if row in self.tx_periodic_timers:
-                    self.tx_periodic_timers[row].stop()
-                    del self.tx_periodic_timers[row]
+                # Stop sending and deactivate message
+                self._unschedule_tx(msg)
                 msg.is_active = False
-                self.populate_tx_table()
+                # Only this row changed (checkbox, background, count)
+                self.tx_model.refresh_row(row)
                 
-                # If no more active timers, update the start/stop button
-                if not any(timer.isActive() for timer in self.tx_periodic_timers.values()):
+                # If nothing is scheduled any more, update the start/stop button
+                if not self._tx_scheduled:
                     self.start_stop_action.setChecked(False)
-                    self.update_status_labels()
+                self._schedule_status_update()
+            else:
+                self.tx_model.refresh_row(row, TxMessagesModel.COL_COUNT, TxMessagesModel.COL_COUNT)
 
     def update_message_active_state(self, row, is_checked):
         """Update the is_active state of a message when its checkbox is toggled."""
         if row < len(self.tx_messages):
-            self.tx_messages[row].is_active = is_checked
-            
-            # Update visual feedback
-            for col in range(self.tx_table.columnCount()):
-                item = self.tx_table.item(row, col)
-                if item:
-                    if is_checked:
-                        item.setBackground(QColor("lightgreen"))
-                    else:
-                        item.setBackground(QColor("white"))
+            msg = self.tx_messages[row]
+            msg.is_active = is_checked
+            
+            # Only the checkbox and row background depend on is_active
+            self.tx_model.refresh_row(row, roles=(Qt.CheckStateRole, Qt.BackgroundRole))
             
-            # If periodic transmission is running, restart affected timers
+            # If periodic transmission is running, add or remove the message from the schedule
             if self.start_stop_action.isChecked():
-                if is_checked and self.tx_messages[row].cycle_ms > 0:
-                    # Start timer for newly activated message
-                    if row not in self.tx_periodic_timers:
-                        timer = QTimer(self)
-                        timer.timeout.connect(lambda r=row: self.send_periodic_message(r))
-                        timer.start(self.tx_messages[row].cycle_ms)
-                        self.tx_periodic_timers[row] = timer
+                if is_checked and msg.cycle_ms > 0:
+                    self._schedule_tx(msg)
                 else:
-                    # Stop timer for deactivated message
-                    if row in self.tx_periodic_timers:
-                        self.tx_periodic_timers[row].stop()
-                        del self.tx_periodic_timers[row]
+                    self._unschedule_tx(msg)
                         
-            self.update_status_labels()
+            self._schedule_status_update()
 
     def get_current_connection_config(self):
         """Get current connection configuration with auto-detection support"""
@@ -1918,14 +2576,14 @@ class AdvancedLeftSidebar(QScrollArea):
         if driver == "auto-detect":
             if interface.startswith(("/dev/tty", "COM")):
                 driver = "slcan"
-                print(f"[DEBUG] Auto-detected SLCAN for interface {interface}")
+                log.debug("Auto-detected SLCAN for interface %s", interface)
             elif interface.startswith(("can", "vcan")):
                 driver = "socketcan"
-                print(f"[DEBUG] Auto-detected SocketCAN for interface {interface}")
+                log.debug("Auto-detected SocketCAN for interface %s", interface)
             else:
                 # Default to SLCAN for unknown interfaces
                 driver = "slcan"
-                print(f"[DEBUG] Auto-detection fallback to SLCAN for interface {interface}")
+                log.debug("Auto-detection fallback to SLCAN for interface %s", interface)
         
         config = {
             'interface': interface,
@@ -1941,7 +2599,7 @@ class AdvancedLeftSidebar(QScrollArea):
             'original_driver_selection': self.driver_combo.currentText()
         }
         
-        print(f"[DEBUG] Connection config: {config}")
+        log.debug("Connection config: %s", config)
         return config
 
     class TxMessageDialog(QDialog):
@@ -1956,9 +2614,17 @@ class AdvancedLeftSidebar(QScrollArea):
             self.message = msg
             self.dbc_manager = getattr(parent, 'dbc_manager', None)
             self.selected_dbc_msg = None
+            self._encode = None  # Encoder for selected_dbc_msg, see _build_encoder
             self.dbc_signals = {}
             self.signal_edits = {}
             self.value_table_combos = {}
+            self._pending_signal_msg = None  # DBC message whose signal editors wait for the group to be shown
+            self._signal_edit_pool = {}  # Signal editors not currently shown, by signal name
+            # Coalesce signal keystrokes/pastes into one DBC encode
+            self._encode_timer = QTimer(self)
+            self._encode_timer.setSingleShot(True)
+            self._encode_timer.setInterval(30)
+            self._encode_timer.timeout.connect(self._update_data_from_signals)
             
             # Flag to prevent DBC from overwriting data during restoration
             self._is_restoring_message = False
@@ -2240,6 +2906,9 @@ class AdvancedLeftSidebar(QScrollArea):
             dbc_layout = QFormLayout(dbc_group)
 
             self.dbc_msg_combo = QComboBox()
+            # Size from a fixed minimum rather than re-measuring every inserted label
+            self.dbc_msg_combo.setSizeAdjustPolicy(QComboBox.AdjustToMinimumContentsLengthWithIcon)
+            self.dbc_msg_combo.setMinimumContentsLength(30)
             self.dbc_msg_combo.currentTextChanged.connect(self._on_dbc_msg_selected)
             dbc_layout.addRow("DBC Message:", self.dbc_msg_combo)
 
@@ -2255,17 +2924,35 @@ class AdvancedLeftSidebar(QScrollArea):
             self.signal_group = QGroupBox("Signal Values")
             self.signal_scroll = QScrollArea()
             self.signal_widget = QWidget()
-            self.signal_layout = QFormLayout(self.signal_widget)
+            self.signal_layout = QGridLayout(self.signal_widget)
+            self.signal_layout.setColumnStretch(1, 1)
+            self.signal_layout.setAlignment(Qt.AlignTop)
             self.signal_scroll.setWidget(self.signal_widget)
             self.signal_scroll.setWidgetResizable(True)
             self.signal_scroll.setMaximumHeight(300)
             
+            # Messages with many signals use a table that only creates an editor for the cell being edited
+            self.signal_model = TxSignalValuesModel(self)
+            self.signal_model.value_edited.connect(self._on_signal_changed)
+            self.signal_table = QTableView()
+            self.signal_table.setModel(self.signal_model)
+            self.signal_table.setItemDelegateForColumn(TxSignalValuesModel.COL_VALUE, TxSignalValueDelegate(self.signal_table))
+            self.signal_table.setEditTriggers(QAbstractItemView.AllEditTriggers)
+            self.signal_table.verticalHeader().setVisible(False)
+            self.signal_table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+            self.signal_table.horizontalHeader().setStretchLastSection(True)
+            self.signal_table.setMaximumHeight(300)
+            self.signal_table.setVisible(False)
+            
             signal_group_layout = QVBoxLayout(self.signal_group)
             signal_group_layout.addWidget(self.signal_scroll)
+            signal_group_layout.addWidget(self.signal_table)
             
             layout.addWidget(self.signal_group)
             
             self.signal_group.setVisible(False)
+            # Signal editors are built the first time the group actually appears on screen
+            self.signal_group.installEventFilter(self)
 
             return tab
 
@@ -2337,52 +3024,50 @@ class AdvancedLeftSidebar(QScrollArea):
             if not self.dbc_msg_combo:
                 return
         
-            self.dbc_msg_combo.clear()
-            self.dbc_msg_combo.addItem("(Manual Entry)")
-            self.dbc_msg_map = {"(Manual Entry)": None}
-
-            if not self.dbc_manager or not hasattr(self.dbc_manager, 'active_database') or not self.dbc_manager.active_database:
-                return
-
+            pairs = [("(Manual Entry)", None)]
             try:
-                # Handle different DBC manager interfaces
-                if hasattr(self.dbc_manager, 'get_all_messages'):
-                    messages = self.dbc_manager.get_all_messages()
-                    if isinstance(messages, dict):
-                        for msg_id, dbc_msg in messages.items():
-                            msg_name = getattr(dbc_msg, 'name', f'Message_{msg_id}')
-                            label = f"{msg_name} (ID: 0x{msg_id:X}, DLC: {getattr(dbc_msg, 'length', 8)})"
-                            self.dbc_msg_combo.addItem(label)
-                            self.dbc_msg_map[label] = dbc_msg
-                    elif isinstance(messages, list):
-                        for dbc_msg in messages:
-                            msg_id = getattr(dbc_msg, 'frame_id', getattr(dbc_msg, 'message_id', None))
-                            if msg_id is not None:
-                                msg_name = getattr(dbc_msg, 'name', f'Message_{msg_id}')
-                                label = f"{msg_name} (ID: 0x{msg_id:X}, DLC: {getattr(dbc_msg, 'length', 8)})"
-                                self.dbc_msg_combo.addItem(label)
-                                self.dbc_msg_map[label] = dbc_msg
-                elif hasattr(self.dbc_manager, 'active_database') and hasattr(self.dbc_manager.active_database, 'messages'):
-                    # Handle cantools database format
-                    db = self.dbc_manager.active_database
-                    if hasattr(db, 'messages'):
-                        messages = db.messages if isinstance(db.messages, list) else []
-                        for dbc_msg in messages:
-                            msg_id = getattr(dbc_msg, 'frame_id', getattr(dbc_msg, 'message_id', None))
-                            if msg_id is not None:
-                                msg_name = getattr(dbc_msg, 'name', f'Message_{msg_id}')
-                                label = f"{msg_name} (ID: 0x{msg_id:X}, DLC: {getattr(dbc_msg, 'length', 8)})"
-                                self.dbc_msg_combo.addItem(label)
-                                self.dbc_msg_map[label] = dbc_msg
-                    # Create a descriptive label
-                    msg_name = getattr(dbc_msg, 'name', f'Message_{msg_id}')
-                    label = f"{msg_name} (ID: 0x{msg_id:X}, DLC: {getattr(dbc_msg, 'length', 8)})"
-                    
-                    self.dbc_msg_combo.addItem(label)
-                    self.dbc_msg_map[label] = dbc_msg
-                    
+                if self.dbc_manager and hasattr(self.dbc_manager, 'active_database') and self.dbc_manager.active_database:
+                    # Create a descriptive label per message
+                    pairs.extend((_dbc_message_label(msg_id, dbc_msg), dbc_msg)
+                                 for msg_id, dbc_msg in self._iter_dbc_messages())
             except Exception as e:
-                print(f"[DEBUG] Could not load DBC messages: {e}")
+                log.debug("Could not load DBC messages: %s", e)
+
+            # Insert every label in one call; the combo's own signals and repaints are held off meanwhile
+            combo = self.dbc_msg_combo
+            combo.setUpdatesEnabled(False)
+            try:
+                with QSignalBlocker(combo):
+                    combo.clear()
+                    self.dbc_msg_map = dict(pairs)
+                    # Combo row per DBC message name, for restoring a message's selection
+                    self._dbc_name_to_index = {}
+                    for index, (_, dbc_msg) in enumerate(pairs):
+                        if dbc_msg is not None:
+                            self._dbc_name_to_index.setdefault(getattr(dbc_msg, 'name', None), index)
+                    combo.addItems([label for label, _ in pairs])
+                    combo.setCurrentIndex(0)
+            finally:
+                combo.setUpdatesEnabled(True)
+
+        def _iter_dbc_messages(self):
+            """Yield (msg_id, dbc_msg) for every message in the active DBC, whatever the manager interface."""
+            if hasattr(self.dbc_manager, 'get_all_messages'):
+                messages = self.dbc_manager.get_all_messages()
+                if isinstance(messages, dict):
+                    yield from messages.items()
+                    return
+                if not isinstance(messages, list):
+                    return
+            else:
+                # Handle cantools database format
+                messages = getattr(self.dbc_manager.active_database, 'messages', None)
+                if not isinstance(messages, list):
+                    return
+            for dbc_msg in messages:
+                msg_id = getattr(dbc_msg, 'frame_id', getattr(dbc_msg, 'message_id', None))
+                if msg_id is not None:
+                    yield msg_id, dbc_msg
 
         def restore_message_data(self):
             """Restore data when editing an existing message"""
@@ -2391,6 +3076,13 @@ class AdvancedLeftSidebar(QScrollArea):
 
             # Set flag to indicate we're restoring (prevents DBC from overwriting data)
             self._is_restoring_message = True
+            # Silence the basic-field widgets so each setter doesn't cascade through its handlers;
+            # the handlers run once below. The DBC combo stays live: its handler must see the restore.
+            widgets = [self.id_edit, self.dlc_spin, self.data_edit, self.cycle_spin, self.count_spin,
+                       self.count_infinite_cb, self.periodic_radio, self.single_shot_radio, self.rtr_cb,
+                       self.extended_id_cb, self.fd_cb, self.brs_cb, self.esi_cb]
+            for widget in widgets:
+                widget.blockSignals(True)
             
             try:
                 # Restore basic fields FIRST (before DBC selection)
@@ -2401,7 +3093,7 @@ class AdvancedLeftSidebar(QScrollArea):
                 # Restore signal values from the current message (not DBC defaults)
                 if hasattr(self.message, 'dbc_signals') and self.message.dbc_signals:
                     self.dbc_signals = self.message.dbc_signals.copy()
-                    print(f"[DEBUG] Restored {len(self.dbc_signals)} signal values from message")
+                    log.debug("Restored %s signal values from message", len(self.dbc_signals))
                 else:
                     self.dbc_signals = {}
                 
@@ -2420,10 +3112,9 @@ class AdvancedLeftSidebar(QScrollArea):
 
                 # Restore DBC selection if available (this will trigger _on_dbc_msg_selected)
                 if hasattr(self.message, 'dbc_name') and self.message.dbc_name:
-                    for i in range(self.dbc_msg_combo.count()):
-                        if self.message.dbc_name in self.dbc_msg_combo.itemText(i):
-                            self.dbc_msg_combo.setCurrentIndex(i)
-                            break
+                    index = getattr(self, '_dbc_name_to_index', {}).get(self.message.dbc_name)
+                    if index is not None:
+                        self.dbc_msg_combo.setCurrentIndex(index)
 
                 # Restore CAN control bits
                 if hasattr(self.message, 'rtr'):
@@ -2432,7 +3123,7 @@ class AdvancedLeftSidebar(QScrollArea):
                     self.extended_id_cb.setChecked(self.message.extended_id)
                 if hasattr(self.message, 'fd'):
                     self.fd_cb.setChecked(self.message.fd)
-                    # Trigger the toggle to enable/disable dependent controls
+                    # Enable/disable dependent controls before BRS/ESI are restored
                     self._on_fd_toggled(self.message.fd)
                 if hasattr(self.message, 'brs'):
                     self.brs_cb.setChecked(self.message.brs)
@@ -2440,9 +3131,18 @@ class AdvancedLeftSidebar(QScrollArea):
                     self.esi_cb.setChecked(self.message.esi)
                     
             finally:
+                for widget in widgets:
+                    widget.blockSignals(False)
+                # Bring dependent controls in line with the restored values, once each
+                with QSignalBlocker(self.dlc_slider):
+                    self.dlc_slider.setValue(self.dlc_spin.value())
+                self._on_mode_changed()
+                if self.count_infinite_cb.isChecked():
+                    self._on_infinite_toggled(True)
+                self._update_data_preview()
                 # Clear restoration flag
                 self._is_restoring_message = False
-                print("[DEBUG] Message data restored successfully, preserving edited values")
+                log.debug("Message data restored successfully, preserving edited values")
 
         def _on_dbc_msg_selected(self, text):
             """Handle DBC message selection"""
@@ -2452,6 +3152,7 @@ class AdvancedLeftSidebar(QScrollArea):
             if self.dbc_msg_map[text] is not None:
                 dbc_msg = self.dbc_msg_map[text]
                 self.selected_dbc_msg = dbc_msg
+                self._encode = self._build_encoder(dbc_msg)
                 
                 # Check if we're restoring an existing message to preserve its data
                 is_restoring = (hasattr(self, '_is_restoring_message') and self._is_restoring_message)
@@ -2469,7 +3170,7 @@ class AdvancedLeftSidebar(QScrollArea):
                             self.dbc_signals[signal.name] = default_val
                 
                 # Always populate signal editors (but preserve existing values when restoring)
-                self._populate_signal_editors(dbc_msg)
+                self._request_signal_editors(dbc_msg)
                 
                 if not is_restoring:
                     # Only update data from signals for new selections, not when restoring
@@ -2484,6 +3185,8 @@ class AdvancedLeftSidebar(QScrollArea):
             else:
                 # Manual entry mode
                 self.selected_dbc_msg = None
+                self._encode = None
+                self._pending_signal_msg = None
                 self.signal_group.setVisible(False)
                 
                 # Enable manual editing
@@ -2491,28 +3194,73 @@ class AdvancedLeftSidebar(QScrollArea):
                 self.dlc_spin.setReadOnly(False)
                 self.data_edit.setReadOnly(False)
 
+        def _request_signal_editors(self, dbc_msg):
+            """Build signal editors now if the group is on screen, otherwise when it is first shown."""
+            self._pending_signal_msg = dbc_msg
+            if self.signal_group.isVisible():
+                self._build_pending_signal_editors()
+
+        def _build_pending_signal_editors(self):
+            """Build the signal editors deferred by _request_signal_editors, if any."""
+            dbc_msg, self._pending_signal_msg = self._pending_signal_msg, None
+            if dbc_msg is not None:
+                self._populate_signal_editors(dbc_msg)
+
+        def eventFilter(self, obj, event):
+            if obj is self.signal_group and event.type() == QEvent.Show:
+                self._build_pending_signal_editors()
+            return super().eventFilter(obj, event)
+
         def _populate_signal_editors(self, dbc_msg):
             """Create editors for each signal in the DBC message"""
-            # Clear existing editors
-            for i in reversed(range(self.signal_layout.count())):
-                item = self.signal_layout.takeAt(i)
-                if item.widget():
-                    item.widget().deleteLater()
+            signals = list(getattr(dbc_msg, 'signals', []))
+            virtualize = len(signals) > _SIGNAL_VIRTUALIZE_THRESHOLD
+            self.signal_model.set_signals(signals if virtualize else [], self.dbc_signals)
+            self.signal_table.setVisible(virtualize)
+            self.signal_scroll.setVisible(not virtualize)
+            
+            # Rebuild the grid in one pass with painting and relayout suspended
+            self.signal_widget.setUpdatesEnabled(False)
+            self.signal_layout.setEnabled(False)
+            try:
+                self._fill_signal_grid([] if virtualize else signals)
+            finally:
+                self.signal_layout.setEnabled(True)
+                self.signal_widget.setUpdatesEnabled(True)
+
+        def _fill_signal_grid(self, signals):
+            """Lay out a label and editor row per signal, reusing pooled editors"""
+            # Take the current rows out; their editors go back to the pool for reuse by signal name
+            while self.signal_layout.count():
+                widget = self.signal_layout.takeAt(self.signal_layout.count() - 1).widget()
+                if isinstance(widget, QLineEdit):
+                    widget.hide()
+                    self._signal_edit_pool[widget.property("dbc_signal_name")] = widget
+                elif widget is not None:
+                    widget.deleteLater()
             
             self.signal_edits = {}
-            
-            is_restoring = getattr(self, '_is_restoring_message', False)
-            if is_restoring:
-                print(f"[DEBUG] Populating signal editors during restoration with {len(self.dbc_signals)} existing values")
-            
-            for signal in getattr(dbc_msg, 'signals', []):
-                # Create editor
-                edit = QLineEdit()
+            self._signals_by_name = {}
+            
+            # Checked once here rather than per signal in the loop below
+            log_restored = getattr(self, '_is_restoring_message', False) and log.isEnabledFor(logging.DEBUG)
+            if log_restored:
+                log.debug("Populating signal editors during restoration with %s existing values", len(self.dbc_signals))
+            
+            for row, signal in enumerate(signals):
+                # Reuse a pooled editor for this signal name, or create one
+                edit = self._signal_edit_pool.pop(signal.name, None)
+                if edit is None:
+                    edit = QLineEdit()
+                    # Connect change handler; one bound slot serves every editor
+                    edit.setProperty("dbc_signal_name", signal.name)
+                    edit.textChanged.connect(self._on_signal_text_changed_dispatch)
                 current_value = self.dbc_signals.get(signal.name, 0)
-                edit.setText(str(current_value))
+                with QSignalBlocker(edit):
+                    edit.setText(str(current_value))
                 
-                if is_restoring and signal.name in self.dbc_signals:
-                    print(f"[DEBUG] Restored signal {signal.name} = {current_value}")
+                if log_restored and signal.name in self.dbc_signals:
+                    log.debug("Restored signal %s = %s", signal.name, current_value)
                 
                 # Set tooltip with signal info
                 tooltip_parts = []
@@ -2523,19 +3271,24 @@ class AdvancedLeftSidebar(QScrollArea):
                 if hasattr(signal, 'comment') and signal.comment:
                     tooltip_parts.append(f"Comment: {signal.comment}")
                 
-                if tooltip_parts:
-                    edit.setToolTip("\n".join(tooltip_parts))
-                
-                # Connect change handler
-                edit.textChanged.connect(lambda text, s=signal: self._on_signal_changed(s, text))
+                edit.setToolTip("\n".join(tooltip_parts))
                 
                 # Create label with units
                 label_text = signal.name
                 if hasattr(signal, 'unit') and signal.unit:
                     label_text += f" ({signal.unit})"
                 
-                self.signal_layout.addRow(label_text, edit)
+                self.signal_layout.addWidget(QLabel(label_text), row, 0)
+                self.signal_layout.addWidget(edit, row, 1)
+                edit.show()
                 self.signal_edits[signal.name] = edit
+                self._signals_by_name[signal.name] = signal
+
+        def _on_signal_text_changed_dispatch(self, text):
+            """Route a signal editor's textChanged to _on_signal_changed for the signal it edits."""
+            signal = self._signals_by_name.get(self.sender().property("dbc_signal_name"))
+            if signal is not None:
+                self._on_signal_changed(signal, text)
 
         def _on_signal_changed(self, signal, text):
             """Handle signal value change"""
@@ -2548,28 +3301,32 @@ class AdvancedLeftSidebar(QScrollArea):
                     value = min(value, signal.maximum)
                     
                 self.dbc_signals[signal.name] = value
-                self._update_data_from_signals()
+                self._encode_timer.start()
             except ValueError:
                 # Invalid input, revert to previous value
                 if signal.name in self.dbc_signals and signal.name in self.signal_edits:
                     self.signal_edits[signal.name].setText(str(self.dbc_signals[signal.name]))
 
+        @staticmethod
+        def _build_encoder(dbc_msg):
+            """Resolve the signals -> bytes encoder for a DBC message once per selection, or None."""
+            encode = getattr(dbc_msg, 'encode', None)
+            if encode is None:
+                log.debug("DBC message has no encode method")
+            return encode
+
         def _update_data_from_signals(self):
             """Update the data field based on current signal values"""
-            if not self.selected_dbc_msg:
+            if not self.selected_dbc_msg or self._encode is None:
                 return
                 
             try:
                 # Use DBC encoding to generate data bytes
-                if hasattr(self.selected_dbc_msg, 'encode'):
-                    data_bytes = self.selected_dbc_msg.encode(self.dbc_signals)
-                    # Convert to hex string
-                    hex_string = ' '.join(f'{b:02X}' for b in data_bytes)
-                    self.data_edit.setText(hex_string)
-                else:
-                    print("[DEBUG] DBC message has no encode method")
+                data_bytes = self._encode(self.dbc_signals)
+                # Convert to hex string
+                self.data_edit.setText(bytes(data_bytes).hex(' ').upper())
             except Exception as e:
-                print(f"[DEBUG] Error encoding DBC message: {e}")
+                log.debug("Error encoding DBC message: %s", e)
 
         def _on_signal_combo_changed(self, signal, value):
             """Handle signal combo box change"""
@@ -2592,10 +3349,13 @@ class AdvancedLeftSidebar(QScrollArea):
                 elif len(bytes_list) > new_dlc:
                     bytes_list = bytes_list[:new_dlc]
                 
-                # Update display based on current format
-                self._update_data_display(bytes_list)
-            
-            self._update_data_preview()
+                # Update display based on current format; the preview is drawn from bytes_list
+                # below, so the edit's textChanged must not re-parse the text we just wrote
+                with QSignalBlocker(self.data_edit):
+                    self._update_data_display(bytes_list)
+                self._update_data_preview(bytes_list)
+            else:
+                self._update_data_preview()
 
         def _parse_data_input(self, data_text):
             """Parse data input based on current format"""
@@ -2604,12 +3364,23 @@ class AdvancedLeftSidebar(QScrollArea):
             
             try:
                 if "Hex Spaced" in format_text:
+                    # Two-digit, single-space text parses in one C call; anything else byte by byte
+                    if len(data_text) % 3 == 2 and data_text[2::3] == ' ' * (len(data_text) // 3):
+                        try:
+                            return list(bytes.fromhex(data_text))
+                        except ValueError:
+                            pass
                     for byte_str in data_text.split():
                         if byte_str:
                             bytes_list.append(int(byte_str, 16))
                 elif "Hex Compact" in format_text:
-                    # Parse pairs of hex characters
+                    # Parse pairs of hex characters (a trailing odd digit is ignored)
                     clean_text = data_text.replace(' ', '')
+                    if clean_text.isalnum():
+                        try:
+                            return list(bytes.fromhex(clean_text[:len(clean_text) - len(clean_text) % 2]))
+                        except ValueError:
+                            pass
                     for i in range(0, len(clean_text), 2):
                         if i + 1 < len(clean_text):
                             bytes_list.append(int(clean_text[i:i+2], 16))
@@ -2630,8 +3401,16 @@ class AdvancedLeftSidebar(QScrollArea):
         def _update_data_display(self, bytes_list):
             """Update data display based on current format"""
             format_text = self.data_format_combo.currentText()
+            try:
+                buf = bytes(bytes_list)
+            except ValueError:
+                buf = None  # Out-of-range values: keep the per-value formatting below
             
-            if "Hex Spaced" in format_text:
+            if "Hex Spaced" in format_text and buf is not None:
+                display_text = buf.hex(' ').upper()
+            elif "Hex Compact" in format_text and buf is not None:
+                display_text = buf.hex().upper()
+            elif "Hex Spaced" in format_text:
                 display_text = ' '.join(f'{b:02X}' for b in bytes_list)
             elif "Hex Compact" in format_text:
                 display_text = ''.join(f'{b:02X}' for b in bytes_list)
@@ -2648,25 +3427,25 @@ class AdvancedLeftSidebar(QScrollArea):
             """Validate and update data input"""
             self._update_data_preview()
 
-        def _update_data_preview(self):
-            """Update the hex dump style preview"""
+        def _update_data_preview(self, bytes_list=None):
+            """Update the hex dump style preview, from bytes_list if given or else the data field"""
             try:
-                bytes_list = self._parse_data_input(self.data_edit.text())
+                if bytes_list is None:
+                    bytes_list = self._parse_data_input(self.data_edit.text())
+                # Values outside 0-255 raise here and show as invalid
+                buf = bytes(bytes_list)
                 
                 # Create hex dump style preview
-                preview_text = "Offset  Hex                                      ASCII\n"
-                preview_text += "------  -----------------------------------------------\n"
+                lines = ["Offset  Hex                                      ASCII",
+                         "------  -----------------------------------------------"]
                 
-                for i in range(0, len(bytes_list), 8):
-                    chunk = bytes_list[i:i+8]
-                    hex_part = ' '.join(f'{b:02X}' for b in chunk)
-                    hex_part = hex_part.ljust(23)  # Pad to consistent width
-                    
-                    ascii_part = ''.join(chr(b) if 32 <= b <= 126 else '.' for b in chunk)
-                    
-                    preview_text += f"{i:04X}    {hex_part}  {ascii_part}\n"
+                for i in range(0, len(buf), 8):
+                    chunk = buf[i:i+8]
+                    hex_part = chunk.hex(' ').upper().ljust(23)  # Pad to consistent width
+                    ascii_part = chunk.translate(_PRINTABLE_TABLE).decode('latin1')
+                    lines.append(f"{i:04X}    {hex_part}  {ascii_part}")
                     
-                self.data_preview.setText(preview_text)
+                self.data_preview.setText("\n".join(lines) + "\n")
             except Exception:
                 self.data_preview.setText("Invalid data format")
 
@@ -2680,12 +3459,7 @@ class AdvancedLeftSidebar(QScrollArea):
                 
             try:
                 # Parse current value
-                if current_text.startswith('0x') or current_text.startswith('0X'):
-                    current_value = int(current_text, 16)
-                elif current_text.startswith('0b'):
-                    current_value = int(current_text, 2)
-                else:
-                    current_value = int(current_text)
+                current_value = _parse_id_text(current_text)
                 
                 # Convert to new format
                 if "Hex" in format_text:
@@ -2752,10 +3526,7 @@ class AdvancedLeftSidebar(QScrollArea):
 
         def _generate_random_data(self):
             """Generate random data based on current DLC"""
-            import random
-            dlc = self.dlc_spin.value()
-            random_bytes = [random.randint(0, 255) for _ in range(dlc)]
-            self._update_data_display(random_bytes)
+            self._update_data_display(list(os.urandom(self.dlc_spin.value())))
 
         def _clear_data(self):
             """Clear all data bytes (set to zero)"""
@@ -2785,7 +3556,7 @@ class AdvancedLeftSidebar(QScrollArea):
                     self.parent().message_templates.append(template)
                 
                 # Could also save to file here
-                print(f"[DEBUG] Saved template: {name}")
+                log.debug("Saved template: %s", name)
 
         def _load_template(self):
             """Load a message template"""
@@ -2820,19 +3591,17 @@ class AdvancedLeftSidebar(QScrollArea):
 
         def accept(self):
             """Override accept to validate input"""
+            # Apply a signal edit still waiting on the encode timer
+            if self._encode_timer.isActive():
+                self._encode_timer.stop()
+                self._update_data_from_signals()
             if not self._validate_input():
                 return
                 
             # Prepare message data for return
             try:
                 # Parse message ID
-                id_text = self.id_edit.text().strip()
-                if id_text.startswith(('0x', '0X')):
-                    msg_id = int(id_text, 16)
-                elif id_text.startswith('0b'):
-                    msg_id = int(id_text, 2)
-                else:
-                    msg_id = int(id_text)
+                msg_id = _parse_id_text(self.id_edit.text().strip())
                 
                 # Validate ID range
                 if self.validate_id_cb.isChecked():
@@ -2876,7 +3645,7 @@ class AdvancedLeftSidebar(QScrollArea):
                 self.result_message = TxMessage(
                     msg_id=f"0x{msg_id:X}",
                     dlc=dlc,
-                    data=' '.join(f'{b:02X}' for b in data_bytes),
+                    data="",  # Filled in from data_bytes below
                     cycle_ms=cycle_ms,
                     count=count,
                     is_active=is_active,
@@ -2888,6 +3657,7 @@ class AdvancedLeftSidebar(QScrollArea):
                     brs=self.brs_cb.isChecked(),
                     esi=self.esi_cb.isChecked()
                 )
+                self.result_message.set_data_bytes(data_bytes)
                 
                 # Add DBC information if applicable
                 if self.selected_dbc_msg:
@@ -2915,13 +3685,7 @@ class AdvancedLeftSidebar(QScrollArea):
                 errors.append("Message ID is required")
             else:
                 try:
-                    if id_text.startswith(('0x', '0X')):
-                        msg_id = int(id_text, 16)
-                    elif id_text.startswith('0b'):
-                        msg_id = int(id_text, 2)
-                    else:
-                        msg_id = int(id_text)
-                        
+                    msg_id = _parse_id_text(id_text)
                     if msg_id < 0:
                         errors.append("Message ID must be positive")
                 except ValueError:
@@ -2968,12 +3732,12 @@ class AdvancedLeftSidebar(QScrollArea):
     def handle_connect(self):
         """Handle connection request"""
         config = self.get_current_connection_config()
-        print(f"[DEBUG] Connect requested with config: {config}")
+        log.debug("Connect requested with config: %s", config)
         self.connect_requested.emit(config)
         
     def handle_disconnect(self):
         """Handle disconnection request"""
-        print("[DEBUG] Disconnect requested")
+        log.debug("Disconnect requested")
         self.disconnect_requested.emit()
         
     def set_connection_state(self, connected):
@@ -2983,28 +3747,10 @@ class AdvancedLeftSidebar(QScrollArea):
         
         if connected:
             self.connection_status.setText("🟢 Connected")
-            self.connection_status.setStyleSheet("""
-                QLabel {
-                    padding: 8px;
-                    background-color: #e8f5e8;
-                    border: 1px solid #4caf50;
-                    border-radius: 4px;
-                    color: #2e7d32;
-                    font-weight: bold;
-                }
-            """)
+            self.connection_status.setStyleSheet(self._CONNECTED_QSS)
         else:
             self.connection_status.setText("🔴 Disconnected")
-            self.connection_status.setStyleSheet("""
-                QLabel {
-                    padding: 8px;
-                    background-color: #ffebee;
-                    border: 1px solid #ef5350;
-                    border-radius: 4px;
-                    color: #c62828;
-                    font-weight: bold;
-                }
-            """)
+            self.connection_status.setStyleSheet(self._DISCONNECTED_QSS)
             
     def apply_modern_style(self):
         """Apply modern styling"""
@@ -5,8 +5,11 @@ Handles all background processing to keep UI responsive
 """
 
 import time
+import queue
+import logging
 import threading
 import collections
+import multiprocessing
 from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -15,6 +18,8 @@ from PySide6.QtCore import (QObject, QThread, Signal, Slot, QMutex, QMutexLocker
                             QTimer, QWaitCondition)
 from PySide6.QtWidgets import QApplication
 
+log = logging.getLogger(__name__)
+
 
 @dataclass
 class CANMessage:
@@ -278,12 +283,174 @@ class MessageProcessor(QObject):
         self.processing_enabled = enabled
 
 
+def _message_search_result(message) -> Dict[str, Any]:
+    """Build the search result dict for a DBC message"""
+    return {
+        'type': 'message',
+        'name': message.name,
+        'id': f"0x{message.frame_id:X}",
+        'id_decimal': message.frame_id,
+        'dlc': message.length,
+        'signals_count': len(message.signals),
+        'comment': getattr(message, 'comment', ''),
+        'transmitters': list(message.senders) if hasattr(message, 'senders') else []
+    }
+
+
+def _signal_search_result(message, signal) -> Dict[str, Any]:
+    """Build the search result dict for a DBC signal"""
+    return {
+        'type': 'signal',
+        'name': signal.name,
+        'message_name': message.name,
+        'message_id': f"0x{message.frame_id:X}",
+        'message_id_decimal': message.frame_id,
+        'start_bit': signal.start,
+        'length': signal.length,
+        'byte_order': 'big_endian' if signal.byte_order == 'big_endian' else 'little_endian',
+        'value_type': 'signed' if signal.is_signed else 'unsigned',
+        'factor': signal.scale,
+        'offset': signal.offset,
+        'unit': signal.unit,
+        'min_value': signal.minimum,
+        'max_value': signal.maximum,
+        'comment': getattr(signal, 'comment', ''),
+        'receivers': list(signal.receivers) if hasattr(signal, 'receivers') else []
+    }
+
+
+def _node_search_result(node) -> Dict[str, Any]:
+    """Build the search result dict for a DBC node"""
+    return {
+        'type': 'node',
+        'name': node.name,
+        'comment': getattr(node, 'comment', ''),
+        'transmitted_messages': [],  # Would need to analyze messages
+        'received_messages': []      # Would need to analyze messages
+    }
+
+
+def _build_search_records(database) -> Dict[str, List[Tuple[str, str, str, Dict[str, Any]]]]:
+    """Flatten a DBC database into picklable (name, name_lower, id_lower, result) records"""
+    records = {'message': [], 'signal': [], 'node': []}
+    
+    for message in database.messages:
+        message_id = f"0x{message.frame_id:X}".lower()
+        records['message'].append(
+            (message.name, message.name.lower(), message_id, _message_search_result(message)))
+        for signal in message.signals:
+            records['signal'].append(
+                (signal.name, signal.name.lower(), '', _signal_search_result(message, signal)))
+    
+    for node in getattr(database, 'nodes', []):
+        records['node'].append((node.name, node.name.lower(), '', _node_search_result(node)))
+    
+    return records
+
+
+def _trigrams(text: str) -> set:
+    """Return the set of 3-character substrings of text"""
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def _build_trigram_index(records) -> Dict[str, Dict[str, List[int]]]:
+    """Map each lowercased name/ID trigram to the record positions containing it, per kind"""
+    index = {}
+    for kind, entries in records.items():
+        postings = collections.defaultdict(list)
+        for position, (_, name_lower, id_lower, _) in enumerate(entries):
+            for gram in _trigrams(name_lower) | _trigrams(id_lower):
+                postings[gram].append(position)
+        index[kind] = dict(postings)
+    return index
+
+
+def _scan_search_records(records, request: DBCSearchRequest, index=None) -> List[Dict[str, Any]]:
+    """Run a search request against flattened DBC records"""
+    case_sensitive = request.case_sensitive
+    search_term = request.search_term if case_sensitive else request.search_term.lower()
+    search_grams = _trigrams(request.search_term.lower())
+    
+    if request.search_type == 'all':
+        # Combined search splits the budget between messages, signals and nodes
+        kinds = ('message', 'signal', 'node')
+        limit = request.max_results // 3
+    else:
+        kinds = (request.search_type,)
+        limit = request.max_results
+    
+    results = []
+    for kind in kinds:
+        entries = records.get(kind, ())
+        postings = index.get(kind) if index else None
+        
+        if postings is not None and search_grams:
+            # Intersect posting lists (shortest first), then verify the candidates
+            posting_lists = sorted((postings.get(gram, ()) for gram in search_grams), key=len)
+            candidates = set(posting_lists[0])
+            for posting_list in posting_lists[1:]:
+                if not candidates:
+                    break
+                candidates.intersection_update(posting_list)
+            positions = sorted(candidates)
+        else:
+            # Terms shorter than a trigram need a full scan
+            positions = range(len(entries))
+        
+        found = 0
+        for position in positions:
+            name, name_lower, id_lower, result = entries[position]
+            haystack = name if case_sensitive else name_lower
+            if haystack.find(search_term) >= 0 or (id_lower and id_lower.find(search_term) >= 0):
+                results.append(result)
+                found += 1
+                if found >= limit:
+                    break
+    
+    return results[:request.max_results]
+
+
+def _search_process_main(request_queue, result_queue, records):
+    """Entry point of the DBC search child process"""
+    index = _build_trigram_index(records)
+    
+    running = True
+    while running:
+        batch = [request_queue.get()]
+        
+        # Drain whatever queued up meanwhile so cancelled requests are skipped
+        while True:
+            try:
+                batch.append(request_queue.get_nowait())
+            except queue.Empty:
+                break
+        
+        cancelled = {item[1] for item in batch if item is not None and item[0] == 'cancel'}
+        
+        for item in batch:
+            if item is None:
+                running = False
+                break
+            if item[0] != 'search' or item[1]['request_id'] in cancelled:
+                continue
+            
+            request = DBCSearchRequest(**item[1])
+            try:
+                result_queue.put((request.request_id, _scan_search_records(records, request, index), None))
+            except Exception as e:
+                result_queue.put((request.request_id, None, str(e)))
+
+
+class _SearchCancelled(Exception):
+    """Raised inside the search loops when the active request was cancelled"""
+
+
 class DBCSearchWorker(QObject):
     """Worker for DBC database searches (keeps UI responsive)"""
     
     # Signals
     search_completed = Signal(str, list)  # request_id, results
-    search_progress = Signal(str, int, int)  # request_id, current, total
+    search_progress = Signal(str, int, int)  # request_id, current, total (in-thread searches only)
     search_error = Signal(str, str)  # request_id, error_message
     
     def __init__(self):
@@ -291,6 +458,39 @@ class DBCSearchWorker(QObject):
         self.dbc_manager = None
         self.search_cache = {}  # Cache recent searches
         self.cache_lock = QMutex()
+        
+        # Cancellation state (cancel() may be called from the UI thread)
+        self._cancelled_requests = collections.deque(maxlen=64)
+        self._active_request_id = None
+        self.cancel_lock = QMutex()
+        
+        # Child process holding the flattened DBC (searches run outside the GIL)
+        self._search_process = None
+        self._request_queue = None
+        self._result_queue = None
+        self._result_reader = None
+        self._pending_searches = {}  # request_id -> cache_key
+        # The process is started in the background on the first search after a DBC load
+        self._process_lock = threading.Lock()
+        self._process_generation = 0  # Bumped whenever the running/starting process is discarded
+        self._process_starting = False
+        self._process_unavailable = False  # Spawning failed for the current DBC
+    
+    @Slot(str)
+    def cancel(self, request_id: str):
+        """Cancel a pending or in-flight search request"""
+        with QMutexLocker(self.cancel_lock):
+            if request_id not in self._cancelled_requests:
+                self._cancelled_requests.append(request_id)
+        
+        if self._search_process is not None:
+            self._request_queue.put(('cancel', request_id))
+    
+    def _check_cancelled(self):
+        """Abort the active search if it has been cancelled"""
+        with QMutexLocker(self.cancel_lock):
+            if self._active_request_id in self._cancelled_requests:
+                raise _SearchCancelled()
     
     @Slot(dict)
     def execute_search(self, search_request_dict: dict):
@@ -298,6 +498,11 @@ class DBCSearchWorker(QObject):
         try:
             request = DBCSearchRequest(**search_request_dict)
             
+            with QMutexLocker(self.cancel_lock):
+                if request.request_id in self._cancelled_requests:
+                    return
+                self._active_request_id = request.request_id
+            
             # Check cache first
             cache_key = f"{request.search_term}_{request.search_type}_{request.case_sensitive}"
             with QMutexLocker(self.cache_lock):
@@ -309,6 +514,17 @@ class DBCSearchWorker(QObject):
                 self.search_error.emit(request.request_id, "No DBC database loaded")
                 return
             
+            # Hand off to the search process when one is running
+            process = self._search_process
+            if process is not None and process.is_alive():
+                with QMutexLocker(self.cache_lock):
+                    self._pending_searches[request.request_id] = cache_key
+                self._request_queue.put(('search', search_request_dict))
+                return
+            
+            # Search here meanwhile; later searches go to the process once it is up
+            self._ensure_search_process()
+            
             results = []
             
             if request.search_type == 'message':
@@ -323,19 +539,128 @@ class DBCSearchWorker(QObject):
                 # Combined search
                 results = self._search_all(request)
             
-            # Cache results
-            with QMutexLocker(self.cache_lock):
-                self.search_cache[cache_key] = results
-                # Limit cache size
-                if len(self.search_cache) > 100:
-                    # Remove oldest entries
-                    oldest_key = next(iter(self.search_cache))
-                    del self.search_cache[oldest_key]
+            self._cache_results(cache_key, results)
             
             self.search_completed.emit(request.request_id, results)
             
+        except _SearchCancelled:
+            # Stale request - drop it without emitting anything
+            pass
         except Exception as e:
             self.search_error.emit(search_request_dict.get('request_id', 'unknown'), str(e))
+        finally:
+            with QMutexLocker(self.cancel_lock):
+                self._active_request_id = None
+    
+    def _cache_results(self, cache_key: str, results: List[Dict[str, Any]]):
+        """Store search results in the bounded cache"""
+        with QMutexLocker(self.cache_lock):
+            self.search_cache[cache_key] = results
+            # Limit cache size
+            if len(self.search_cache) > 100:
+                # Remove oldest entries
+                oldest_key = next(iter(self.search_cache))
+                del self.search_cache[oldest_key]
+    
+    def _read_process_results(self, result_queue):
+        """Forward results from the search process (runs in a reader thread)"""
+        while True:
+            item = result_queue.get()
+            if item is None:
+                break
+            
+            request_id, results, error = item
+            with QMutexLocker(self.cache_lock):
+                cache_key = self._pending_searches.pop(request_id, None)
+            with QMutexLocker(self.cancel_lock):
+                if request_id in self._cancelled_requests:
+                    continue
+            
+            if error is not None:
+                self.search_error.emit(request_id, error)
+                continue
+            
+            if cache_key is not None:
+                self._cache_results(cache_key, results)
+            self.search_completed.emit(request_id, results)
+    
+    def _ensure_search_process(self):
+        """Start the search process in a background thread unless it is running or starting"""
+        if not getattr(self.dbc_manager, 'database', None):
+            return
+        
+        with self._process_lock:
+            if (self._search_process is not None or self._process_starting
+                    or self._process_unavailable):
+                return
+            self._process_starting = True
+            generation = self._process_generation
+        
+        threading.Thread(target=self._start_search_process, args=(generation,), daemon=True).start()
+    
+    def _start_search_process(self, generation: int):
+        """Spawn the search process with a flattened copy of the active DBC (starter thread)"""
+        database = getattr(self.dbc_manager, 'database', None)
+        
+        try:
+            records = _build_search_records(database)
+            context = multiprocessing.get_context('spawn')
+            request_queue = context.Queue()
+            result_queue = context.Queue()
+            process = context.Process(target=_search_process_main,
+                                      args=(request_queue, result_queue, records),
+                                      daemon=True)
+            process.start()
+        except Exception:
+            # Keep searching in the worker thread for this DBC
+            log.warning("DBC search process unavailable, searching in thread", exc_info=True)
+            with self._process_lock:
+                if generation == self._process_generation:
+                    self._process_starting = False
+                    self._process_unavailable = True
+            return
+        
+        with self._process_lock:
+            current = generation == self._process_generation
+            if current:
+                self._process_starting = False
+                self._request_queue = request_queue
+                self._result_queue = result_queue
+                self._result_reader = threading.Thread(target=self._read_process_results,
+                                                       args=(result_queue,), daemon=True)
+                self._result_reader.start()
+                self._search_process = process
+        
+        if not current:
+            # The DBC changed (or the worker shut down) while starting; discard this process
+            request_queue.put(None)
+            process.join(1.0)
+            if process.is_alive():
+                process.terminate()
+    
+    def _stop_search_process(self):
+        """Stop the search process and its reader thread; a start in progress is discarded"""
+        with self._process_lock:
+            self._process_generation += 1
+            self._process_starting = False
+            self._process_unavailable = False
+            process = self._search_process
+            self._search_process = None
+            request_queue, result_queue, reader = self._request_queue, self._result_queue, self._result_reader
+        
+        if process is None:
+            return
+        
+        request_queue.put(None)
+        process.join(1.0)
+        if process.is_alive():
+            process.terminate()
+        
+        result_queue.put(None)
+        reader.join(1.0)
+        
+        with QMutexLocker(self.cache_lock):
+            self._pending_searches.clear()
     
     def _search_messages(self, request: DBCSearchRequest) -> List[Dict[str, Any]]:
         """Search for messages in DBC database"""
@@ -353,21 +678,13 @@ class DBCSearchWorker(QObject):
             for i, message in enumerate(messages):
                 # Emit progress
                 if i % 10 == 0:  # Update every 10 messages
+                    self._check_cancelled()
                     self.search_progress.emit(request.request_id, i, total_messages)
                 
                 message_name = message.name.lower() if not request.case_sensitive else message.name
                 
                 if search_term in message_name or search_term in f"0x{message.frame_id:X}".lower():
-                    results.append({
-                        'type': 'message',
-                        'name': message.name,
-                        'id': f"0x{message.frame_id:X}",
-                        'id_decimal': message.frame_id,
-                        'dlc': message.length,
-                        'signals_count': len(message.signals),
-                        'comment': getattr(message, 'comment', ''),
-                        'transmitters': list(message.senders) if hasattr(message, 'senders') else []
-                    })
+                    results.append(_message_search_result(message))
                     
                     if len(results) >= request.max_results:
                         break
@@ -375,6 +692,8 @@ class DBCSearchWorker(QObject):
             # Final progress update
             self.search_progress.emit(request.request_id, total_messages, total_messages)
             
+        except _SearchCancelled:
+            raise
         except Exception as e:
             raise Exception(f"Message search error: {str(e)}")
         
@@ -400,29 +719,13 @@ class DBCSearchWorker(QObject):
                     
                     # Emit progress
                     if processed_signals % 20 == 0:
+                        self._check_cancelled()
                         self.search_progress.emit(request.request_id, processed_signals, total_signals)
                     
                     signal_name = signal.name.lower() if not request.case_sensitive else signal.name
                     
                     if search_term in signal_name:
-                        results.append({
-                            'type': 'signal',
-                            'name': signal.name,
-                            'message_name': message.name,
-                            'message_id': f"0x{message.frame_id:X}",
-                            'message_id_decimal': message.frame_id,
-                            'start_bit': signal.start,
-                            'length': signal.length,
-                            'byte_order': 'big_endian' if signal.byte_order == 'big_endian' else 'little_endian',
-                            'value_type': 'signed' if signal.is_signed else 'unsigned',
-                            'factor': signal.scale,
-                            'offset': signal.offset,
-                            'unit': signal.unit,
-                            'min_value': signal.minimum,
-                            'max_value': signal.maximum,
-                            'comment': getattr(signal, 'comment', ''),
-                            'receivers': list(signal.receivers) if hasattr(signal, 'receivers') else []
-                        })
+                        results.append(_signal_search_result(message, signal))
                         
                         if len(results) >= request.max_results:
                             break
@@ -433,6 +736,8 @@ class DBCSearchWorker(QObject):
             # Final progress update
             self.search_progress.emit(request.request_id, total_signals, total_signals)
             
+        except _SearchCancelled:
+            raise
         except Exception as e:
             raise Exception(f"Signal search error: {str(e)}")
         
@@ -451,22 +756,19 @@ class DBCSearchWorker(QObject):
             nodes = self.dbc_manager.database.nodes
             
             for i, node in enumerate(nodes):
+                self._check_cancelled()
                 self.search_progress.emit(request.request_id, i, len(nodes))
                 
                 node_name = node.name.lower() if not request.case_sensitive else node.name
                 
                 if search_term in node_name:
-                    results.append({
-                        'type': 'node',
-                        'name': node.name,
-                        'comment': getattr(node, 'comment', ''),
-                        'transmitted_messages': [],  # Would need to analyze messages
-                        'received_messages': []      # Would need to analyze messages
-                    })
+                    results.append(_node_search_result(node))
                     
                     if len(results) >= request.max_results:
                         break
             
+        except _SearchCancelled:
+            raise
         except Exception as e:
             raise Exception(f"Node search error: {str(e)}")
         
@@ -525,6 +827,13 @@ class DBCSearchWorker(QObject):
         # Clear cache when DBC changes
         with QMutexLocker(self.cache_lock):
             self.search_cache.clear()
+        
+        # Drop the process for the old database; the next search starts one for the new database
+        self._stop_search_process()
+    
+    def shutdown(self):
+        """Stop the search process"""
+        self._stop_search_process()
     
     @Slot()
     def clear_cache(self):
@@ -545,6 +854,9 @@ class TransmitMessageWorker(QObject):
         super().__init__()
         self.active_transmissions = {}  # message_id -> transmission_info
         self.transmission_lock = QMutex()
+        
+        self.dbc_manager = None
+        self._signal_defaults = {}  # frame_id -> {signal_name: default value}
     
     @Slot(dict)
     def compose_message_async(self, request_dict: dict):
@@ -564,18 +876,52 @@ class TransmitMessageWorker(QObject):
     
     def _encode_message_with_dbc(self, message_id: int, signal_values: Dict[str, Any]) -> Dict[str, Any]:
         """Encode message using DBC database (CPU intensive)"""
-        # This would use the DBC manager to encode signals into raw data
-        # Implementation depends on the DBC library
+        database = (getattr(self.dbc_manager, 'database', None) or
+                    getattr(self.dbc_manager, 'active_database', None))
+        message = None
+        if database:
+            try:
+                message = database.get_message_by_frame_id(message_id)
+            except (KeyError, AttributeError):
+                message = None
+        
+        if message is None:
+            # Not in the DBC - nothing to encode
+            return {
+                'id': message_id,
+                'data': b'\x00' * 8,
+                'dlc': 8,
+                'is_extended': message_id > 0x7FF,
+                'signals': signal_values
+            }
+        
+        # Per-message defaults are built once; cantools packs with its compiled bitstruct codec
+        defaults = self._signal_defaults.get(message.frame_id)
+        if defaults is None:
+            defaults = {signal.name: getattr(signal, 'initial', None) or 0 for signal in message.signals}
+            self._signal_defaults[message.frame_id] = defaults
+        
+        values = dict(defaults)
+        for name, value in signal_values.items():
+            if name in values:
+                values[name] = value
+        
+        data = message.encode(values, strict=False)
         
-        # Placeholder implementation
         return {
             'id': message_id,
-            'data': b'\x00' * 8,  # Would be actual encoded data
-            'dlc': 8,
-            'is_extended': message_id > 0x7FF,
-            'signals': signal_values
+            'data': data,
+            'dlc': message.length,
+            'is_extended': message.is_extended_frame or message_id > 0x7FF,
+            'signals': values
         }
     
+    @Slot(object)
+    def set_dbc_manager(self, dbc_manager):
+        """Set DBC manager for message encoding"""
+        self.dbc_manager = dbc_manager
+        self._signal_defaults.clear()
+    
     @Slot(str, dict)
     def start_periodic_transmission(self, message_id: str, transmission_config: dict):
         """Start periodic message transmission"""
@@ -630,6 +976,8 @@ class ThreadingManager(QObject):
         """Gracefully shutdown all worker threads"""
         print("🔄 Shutting down worker threads...")
         
+        self.dbc_search_worker.shutdown()
+        
         # Stop threads
         self.message_processor_thread.quit()
         self.dbc_search_thread.quit()
@@ -646,3 +994,4 @@ class ThreadingManager(QObject):
         """Set DBC manager for all workers that need it"""
         self.message_processor.set_dbc_manager(dbc_manager)
         self.dbc_search_worker.set_dbc_manager(dbc_manager)
+        self.transmit_worker.set_dbc_manager(dbc_manager)